@@ -1,8 +1,8 @@
 import subprocess
 import os
 import sys
-import sqlite3
-from Launcher.DB.PHDatabase import DB_PATH
+from Launcher.Models.PHGameModel import PHGameModel
+from Launcher.Models.PHLibraryStore import library_store
 from Launcher.Utils.Utils import get_user_config_path, launch_xenia_with_flags
 import configparser
 
@@ -13,19 +13,12 @@ class GameListController:
         config.read(str(get_user_config_path()))
         self.emulator_path = config.get('paths', 'xenia_path', fallback='')
 
-    def fetch_games(self) -> list[tuple]:
+    def fetch_games(self) -> list[PHGameModel]:
         """
-        Return a list of tuples (id, title, cover_path, last_played, play_count)
-        by querying the database.  The ViewModel should filter these further if needed.
+        Return the games in title order, straight from the shared library store
+        (not a copy, so don't modify it).  The ViewModel should filter these further if needed.
         """
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT id, title, cover_path, last_played, play_count FROM games ORDER BY title ASC"
-        )
-        rows = cursor.fetchall()
-        conn.close()
-        return rows
+        return library_store().games()
 
     def launch_game(self, game_id: int):
         """Launch the given game ID via Xenia with flags."""
@@ -37,19 +30,8 @@ class GameListController:
                 from PySide6.QtWidgets import QMessageBox
                 QMessageBox.critical(None, "Launch Error", str(e))
                 return
-            # Update play_count and last_played in the database
-            conn = sqlite3.connect(DB_PATH)
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                UPDATE games
-                   SET play_count = play_count + 1,
-                       last_played = datetime('now')
-                 WHERE id = ?
-                """, (game_id,)
-            )
-            conn.commit()
-            conn.close()
+            # Update play_count and last_played
+            library_store().record_launch(game_id)
 
     def reveal_in_file_browser(self, game_id: int):
         
@@ -70,29 +52,26 @@ class GameListController:
         
         # Update just the cover_path column for a given game_id.
         
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        cursor.execute(
-            "UPDATE games SET cover_path = ? WHERE id = ?",
-            (cover_path, game_id)
-        )
-        conn.commit()
-        conn.close()
+        library_store().set_cover(game_id, cover_path)
 
     def delete_game(self, game_id: int):
         
         # Remove a game row from the database.
         
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM games WHERE id = ?", (game_id,))
-        conn.commit()
-        conn.close()
+        library_store().delete_game(game_id)
 
     def get_file_path(self, game_id: int) -> str:
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        cursor.execute("SELECT file_path FROM games WHERE id = ?", (game_id,))
-        row = cursor.fetchone()
-        conn.close()
-        return row[0] if row else ""
\ No newline at end of file
+        return library_store().get_file_path(game_id)
+
+    def tags(self) -> list[tuple[int, str]]:
+        return library_store().tags()
+
+    def tag_ids(self, game_id: int) -> set[int]:
+        return library_store().tags_of(game_id)
+
+    def set_tag(self, game_id: int, tag_id: int, tagged: bool):
+        library_store().set_game_tag(game_id, tag_id, tagged)
+
+    def add_new_tag(self, game_id: int, name: str):
+        """Create a tag (or find the existing one by that name) and tag the game with it."""
+        self.set_tag(game_id, library_store().create_tag(name), True)
@@ -1,11 +1,10 @@
 # Launcher/Controllers/PHGameWidgetController.py
 import os
 import sys
-import sqlite3
 import subprocess
 from pathlib import Path
 
-from Launcher.DB.PHDatabase import DB_PATH
+from Launcher.Models.PHLibraryStore import library_store
 from Launcher.Utils.Utils import get_user_config_path, launch_xenia_with_flags
 import configparser
 
@@ -18,12 +17,7 @@ class GameWidgetController:
         self.emulator_path = config.get('paths', 'xenia_path', fallback='')
 
     def get_file_path(self) -> str:
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        cursor.execute("SELECT file_path FROM games WHERE id = ?", (self.game_id,))
-        row = cursor.fetchone()
-        conn.close()
-        return row[0] if row else ''
+        return library_store().get_file_path(self.game_id)
 
     def launch_game(self):
         file_path = self.get_file_path()
@@ -34,19 +28,8 @@ class GameWidgetController:
                 from PySide6.QtWidgets import QMessageBox
                 QMessageBox.critical(None, "Launch Error", str(e))
                 return
-            # Update play_count and last_played in the database
-            conn = sqlite3.connect(DB_PATH)
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                UPDATE games
-                   SET play_count = play_count + 1,
-                       last_played = datetime('now')
-                 WHERE id = ?
-                """, (self.game_id,)
-            )
-            conn.commit()
-            conn.close()
+            # Update play_count and last_played
+            library_store().record_launch(self.game_id)
 
     def reveal_in_file_browser(self):
         file_path = self.get_file_path()
@@ -60,29 +43,24 @@ class GameWidgetController:
             subprocess.Popen(['xdg-open', os.path.dirname(file_path)])
 
     def set_cover(self, cover_path: str):
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        cursor.execute(
-            "UPDATE games SET cover_path = ? WHERE id = ?",
-            (cover_path, self.game_id)
-        )
-        conn.commit()
-        conn.close()
+        library_store().set_cover(self.game_id, cover_path)
 
     def remove_cover(self):
         """Remove the cover art for this game by setting cover_path to an empty string."""
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        cursor.execute(
-            "UPDATE games SET cover_path = '' WHERE id = ?",
-            (self.game_id,)
-        )
-        conn.commit()
-        conn.close()
+        library_store().set_cover(self.game_id, '')
 
     def delete_game(self):
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM games WHERE id = ?", (self.game_id,))
-        conn.commit()
-        conn.close()
\ No newline at end of file
+        library_store().delete_game(self.game_id)
+
+    def tags(self) -> list[tuple[int, str]]:
+        return library_store().tags()
+
+    def tag_ids(self) -> set[int]:
+        return library_store().tags_of(self.game_id)
+
+    def set_tag(self, tag_id: int, tagged: bool):
+        library_store().set_game_tag(self.game_id, tag_id, tagged)
+
+    def add_new_tag(self, name: str):
+        """Create a tag (or find the existing one by that name) and tag this game with it."""
+        self.set_tag(library_store().create_tag(name), True)
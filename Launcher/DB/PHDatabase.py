@@ -1,7 +1,14 @@
+import queue
 import sqlite3
 import shutil
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from pathlib import Path
 from Launcher.Utils.Utils import resource_path
+from Launcher.Utils.PHSearchQuery import compile_query
 
 # Determine paths for bundled DB and user-writable DB
 bundle_db = Path(resource_path("perch.db"))
@@ -17,20 +24,342 @@ if not user_db.exists():
         pass
 DB_PATH = user_db
 
-def initialize_db():
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    cursor.execute(
-        """
-        CREATE TABLE IF NOT EXISTS games (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            file_path TEXT NOT NULL UNIQUE,
-            cover_path TEXT,
-            last_played TEXT,
-            play_count INTEGER DEFAULT 0
+# How long a statement waits on another connection's write lock before failing
+BUSY_TIMEOUT_MS = 5000
+# Prepared statements kept per connection (sqlite3's default is 128)
+STATEMENT_CACHE_SIZE = 256
+# Deferred writes allowed to wait before submit() blocks the caller
+WRITE_QUEUE_SIZE = 1000
+# Deferred writes committed together in one transaction
+WRITE_BATCH_SIZE = 100
+# Wait before retrying deferred writes that found the database locked; doubles up to the max
+WRITE_RETRY_SECONDS = 0.25
+WRITE_RETRY_MAX_SECONDS = 8.0
+
+_local = threading.local()
+_stats_lock = threading.Lock()
+_query_stats: dict[str, "QueryStats"] = {}
+_connections_opened = 0
+
+
+@dataclass
+class QueryStats:
+    sql: str
+    calls: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+
+# ─── Connections ─────────────────────────────────────────────────────────
+
+def get_connection() -> sqlite3.Connection:
+    """
+    The calling thread's connection, opened on first use and kept for the life
+    of the thread. It runs in autocommit mode: a lone statement commits by
+    itself, and several statements are grouped with transaction().
+    """
+    global _connections_opened
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect(
+            DB_PATH,
+            timeout=BUSY_TIMEOUT_MS / 1000,
+            isolation_level=None,
+            cached_statements=STATEMENT_CACHE_SIZE,
         )
+        # WAL lets the GUI read while a scan writes; NORMAL only syncs at checkpoints
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+        # Lets deleting a game or tag clear its game_tags rows
+        conn.execute("PRAGMA foreign_keys = ON")
+        _local.conn = conn
+        with _stats_lock:
+            _connections_opened += 1
+    return conn
+
+
+def close_connection():
+    """Close the calling thread's connection, if it has one."""
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        conn.close()
+        _local.conn = None
+
+
+@contextmanager
+def transaction():
+    """
+    Run the enclosed statements as one transaction on this thread's connection,
+    rolling back if an exception escapes. Nested uses join the outer transaction.
+    """
+    conn = get_connection()
+    if conn.in_transaction:
+        yield conn
+        return
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.rollback()
+        raise
+    conn.commit()
+
+
+# ─── Timed statements ────────────────────────────────────────────────────
+
+def execute(sql: str, params=()) -> sqlite3.Cursor:
+    start = time.perf_counter()
+    try:
+        return get_connection().execute(sql, params)
+    finally:
+        _record(sql, time.perf_counter() - start)
+
+
+def executemany(sql: str, seq_of_params) -> sqlite3.Cursor:
+    """Run sql for every parameter tuple, inside one transaction."""
+    start = time.perf_counter()
+    try:
+        with transaction() as conn:
+            return conn.executemany(sql, seq_of_params)
+    finally:
+        _record(sql, time.perf_counter() - start)
+
+
+def fetch_all(sql: str, params=()) -> list[tuple]:
+    start = time.perf_counter()
+    try:
+        return get_connection().execute(sql, params).fetchall()
+    finally:
+        _record(sql, time.perf_counter() - start)
+
+
+def fetch_one(sql: str, params=()) -> tuple | None:
+    start = time.perf_counter()
+    try:
+        return get_connection().execute(sql, params).fetchone()
+    finally:
+        _record(sql, time.perf_counter() - start)
+
+
+def _record(sql: str, elapsed: float):
+    key = " ".join(sql.split())
+    with _stats_lock:
+        entry = _query_stats.get(key)
+        if entry is None:
+            entry = _query_stats[key] = QueryStats(key)
+        entry.calls += 1
+        entry.total_seconds += elapsed
+        entry.max_seconds = max(entry.max_seconds, elapsed)
+
+
+def get_query_stats() -> list[QueryStats]:
+    """Counters for every statement run so far, most total time first."""
+    with _stats_lock:
+        stats = [QueryStats(s.sql, s.calls, s.total_seconds, s.max_seconds)
+                 for s in _query_stats.values()]
+    return sorted(stats, key=lambda s: s.total_seconds, reverse=True)
+
+
+def reset_query_stats():
+    with _stats_lock:
+        _query_stats.clear()
+
+
+def format_query_stats(limit: int = 15) -> str:
+    """A plain-text summary of get_query_stats() for display."""
+    stats = get_query_stats()
+    total_calls = sum(s.calls for s in stats)
+    total_ms = sum(s.total_seconds for s in stats) * 1000
+    lines = [f"{total_calls} statements in {total_ms:.1f} ms, "
+             f"{_connections_opened} connection(s) opened",
+             f"{_write_behind.batches_written} deferred write batch(es), "
+             f"{_write_behind.retries} retried while locked, "
+             f"{_write_behind.writes_failed} failed", ""]
+    for s in stats[:limit]:
+        sql = s.sql if len(s.sql) <= 80 else s.sql[:77] + "..."
+        lines.append(f"{s.calls:>6} x  {s.total_seconds * 1000:8.1f} ms total  "
+                     f"{s.max_seconds * 1000:7.2f} ms max  {sql}")
+    return "\n".join(lines)
+
+
+# ─── Deferred writes ─────────────────────────────────────────────────────
+
+class WriteBehindQueue:
+    """
+    A single background thread that applies small writes (launch stats, cover
+    changes) so the GUI thread never waits on the disk for them. Whatever has
+    queued up is committed together in one transaction. The queue is bounded:
+    once it is full, submit() waits for the writer to catch up.
+
+    Reads don't wait for it: callers keep the in-memory library (LibraryStore)
+    current themselves, and only flush() before re-reading what they wrote.
+    A batch that finds the database locked is retried, backing off, until it
+    lands; only a write that fails by itself (a constraint, say) is dropped.
+    """
+
+    def __init__(self, max_pending: int = WRITE_QUEUE_SIZE, batch_size: int = WRITE_BATCH_SIZE):
+        self.batch_size = batch_size
+        self.batches_written = 0
+        self.retries = 0
+        self.writes_failed = 0
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def submit(self, sql: str, params=()):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="PHDatabaseWriter", daemon=True)
+                self._thread.start()
+        self._queue.put((sql, params))
+
+    def flush(self):
+        """Block until every write submitted so far has been committed."""
+        if self._queue.unfinished_tasks:
+            self._queue.join()
+
+    def close(self):
+        """Commit what is queued, stop the writer and checkpoint the WAL to disk."""
+        self.flush()
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join()
+        # With synchronous=NORMAL, commits reach disk at checkpoints; force one now
+        execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            while batch[-1] is not None and len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            writes = [item for item in batch if item is not None]
+            try:
+                self._write(writes)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if batch[-1] is None:
+                close_connection()
+                return
+
+    def _write(self, writes: list):
+        delay = WRITE_RETRY_SECONDS
+        while True:
+            try:
+                with transaction():
+                    for sql, params in writes:
+                        execute(sql, params)
+                self.batches_written += 1
+                return
+            except sqlite3.Error as e:
+                if not _is_locked(e):
+                    break
+            # Another connection kept the lock past the busy timeout; it will let go
+            self.retries += 1
+            time.sleep(delay)
+            delay = min(delay * 2, WRITE_RETRY_MAX_SECONDS)
+        if len(writes) == 1:
+            self.writes_failed += 1
+            return
+        # Apply them one by one so a single bad write doesn't lose the rest
+        for write in writes:
+            self._write([write])
+
+
+def _is_locked(error: sqlite3.Error) -> bool:
+    code = getattr(error, "sqlite_errorcode", None)
+    return code is not None and (code & 0xFF) in (sqlite3.SQLITE_BUSY, sqlite3.SQLITE_LOCKED)
+
+
+_write_behind = WriteBehindQueue()
+
+
+def flush_writes():
+    _write_behind.flush()
+
+
+def shutdown():
+    """Write out everything still queued; call once before the process exits."""
+    _write_behind.close()
+
+
+# ─── Game rows ───────────────────────────────────────────────────────────
+
+def record_launch(game_id: int) -> str:
+    """
+    Bump play_count and set last_played to now, in the background.
+    Returns the timestamp stored, in SQLite's datetime('now') format.
+    """
+    played_at = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+    _write_behind.submit(
         """
+        UPDATE games
+           SET play_count = play_count + 1,
+               last_played = ?
+         WHERE id = ?
+        """, (played_at, game_id)
     )
-    conn.commit()
-    conn.close()
\ No newline at end of file
+    return played_at
+
+
+def set_cover_path(game_id: int, cover_path: str):
+    """Store a cover, in the background; '' marks a cover the user removed."""
+    _write_behind.submit("UPDATE games SET cover_path = ? WHERE id = ?", (cover_path, game_id))
+
+
+def delete_game(game_id: int):
+    execute("DELETE FROM games WHERE id = ?", (game_id,))
+
+
+def fetch_tags() -> list[tuple[int, str]]:
+    return fetch_all("SELECT id, name FROM tags ORDER BY name")
+
+
+def fetch_game_tags() -> list[tuple[int, int]]:
+    """Every (tag_id, game_id) assignment."""
+    return fetch_all("SELECT tag_id, game_id FROM game_tags")
+
+
+def create_tag(name: str) -> int:
+    """Id of the tag with this name (case-insensitive), creating it if needed."""
+    execute("INSERT OR IGNORE INTO tags (name) VALUES (?)", (name,))
+    return fetch_one("SELECT id FROM tags WHERE name = ?", (name,))[0]
+
+
+def delete_tag(tag_id: int):
+    execute("DELETE FROM tags WHERE id = ?", (tag_id,))
+
+
+def set_game_tag(game_id: int, tag_id: int, tagged: bool):
+    """Add or remove one tag from a game, in the background."""
+    if tagged:
+        _write_behind.submit(
+            "INSERT OR IGNORE INTO game_tags (game_id, tag_id) VALUES (?, ?)", (game_id, tag_id)
+        )
+    else:
+        _write_behind.submit(
+            "DELETE FROM game_tags WHERE game_id = ? AND tag_id = ?", (game_id, tag_id)
+        )
+
+
+def search_game_ids(text: str) -> list[int]:
+    """Ids of the games matching a search-bar query (see PHSearchQuery), best match first."""
+    query = compile_query(text)
+    if query is None:
+        return []
+    return [row[0] for row in fetch_all(query.sql, query.bind())]
+
+
+# ─── Schema ──────────────────────────────────────────────────────────────
+
+def initialize_db():
+    """Create or upgrade the schema and re-key titles if the sort rules changed; see PHMigrations."""
+    from Launcher.DB.PHMigrations import run_migrations, refresh_sort_keys  # PHMigrations builds on this module
+    run_migrations()
+    refresh_sort_keys()
@@ -0,0 +1,324 @@
+# Launcher/DB/PHMigrations.py
+"""
+Versioned schema changes for the games database.
+
+The schema version lives in PRAGMA user_version. Each migration's schema step
+runs in one transaction; a backfill, if any, then runs in small committed
+batches so a large library never holds the write lock for long. The version is
+only bumped once both have finished, and every step is written so that running
+it again is harmless, so an interrupted upgrade simply resumes on next start.
+"""
+import sqlite3
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable
+
+from Launcher.DB.PHDatabase import get_connection
+from Launcher.Utils.PHGameMetadata import file_extension
+from Launcher.Utils.PHSortKey import sort_key, sort_articles
+
+# Rows touched per backfill transaction
+BACKFILL_BATCH_SIZE = 1000
+# Collections every new library starts with
+DEFAULT_TAGS = ("Favorites", "Co-op", "Kinect", "Finished")
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    description: str
+    apply: Callable[[sqlite3.Connection], None]
+    # Called repeatedly with a batch size until it reports 0 rows handled
+    backfill: Callable[[sqlite3.Connection, int], int] | None = None
+
+
+def schema_version(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+@contextmanager
+def _transaction(conn: sqlite3.Connection):
+    """
+    One transaction on conn itself, which need not be this thread's connection;
+    joins a transaction the caller already has open.
+    """
+    if conn.in_transaction:
+        yield
+        return
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield
+    except BaseException:
+        conn.rollback()
+        raise
+    conn.commit()
+
+
+def run_migrations(conn: sqlite3.Connection | None = None,
+                   batch_size: int = BACKFILL_BATCH_SIZE) -> list[int]:
+    """Bring the database up to the latest version; returns the versions applied."""
+    conn = conn or get_connection()
+    applied = []
+    for migration in MIGRATIONS:
+        if migration.version <= schema_version(conn):
+            continue
+        with _transaction(conn):
+            migration.apply(conn)
+        if migration.backfill is not None:
+            while True:
+                with _transaction(conn):
+                    if not migration.backfill(conn, batch_size):
+                        break
+        with _transaction(conn):
+            conn.execute(f"PRAGMA user_version = {migration.version}")
+        applied.append(migration.version)
+    return applied
+
+
+def _add_missing_columns(conn, table: str, columns: dict[str, str]):
+    """Add any of the given columns (name -> type) that an older database lacks."""
+    existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+    for name, decl in columns.items():
+        if name not in existing:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {decl}")
+
+
+# ─── Migrations ──────────────────────────────────────────────────────────
+
+def _create_games(conn):
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS games (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            file_path TEXT NOT NULL UNIQUE,
+            cover_path TEXT,
+            last_played TEXT,
+            play_count INTEGER DEFAULT 0
+        )
+        """
+    )
+
+
+def _add_file_stats(conn):
+    # File stats recorded by the scanner, used to spot moved and vanished files
+    _add_missing_columns(conn, "games", {
+        "file_size": "INTEGER",
+        "file_mtime": "INTEGER",
+        "file_inode": "INTEGER",
+    })
+
+
+def _add_header_metadata(conn):
+    # Header metadata, valid while (meta_size, meta_mtime) match the file's stats
+    _add_missing_columns(conn, "games", {
+        "title_id": "TEXT",
+        "media_id": "TEXT",
+        "meta_size": "INTEGER",
+        "meta_mtime": "INTEGER",
+    })
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_games_title_id ON games (title_id, media_id)")
+
+
+def _add_icon_checked(conn):
+    # Set once the embedded-icon extractor has looked at a file
+    _add_missing_columns(conn, "games", {"icon_checked": "INTEGER DEFAULT 0"})
+
+
+def _add_fingerprints(conn):
+    # Partial-content fingerprint, valid while (fp_size, fp_mtime) match the file's stats
+    _add_missing_columns(conn, "games", {
+        "fingerprint": "TEXT",
+        "fp_size": "INTEGER",
+        "fp_mtime": "INTEGER",
+    })
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_games_fingerprint ON games (fingerprint)")
+
+
+def _create_scan_manifest(conn):
+    # One row per scanned directory; lets the scanner skip unchanged subtrees
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS scan_manifest (
+            dir_path TEXT PRIMARY KEY,
+            mtime INTEGER NOT NULL,
+            entry_count INTEGER NOT NULL
+        )
+        """
+    )
+
+
+def _add_sort_keys(conn):
+    # Sort keys; each index ends in id so keyset pages resume at an exact row
+    _add_missing_columns(conn, "games", {"sort_key": "TEXT"})
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_games_sort_key ON games (sort_key, id)")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_games_last_played ON games (coalesce(last_played, ''), id)"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_games_play_count ON games (coalesce(play_count, 0), id)"
+    )
+
+
+def _backfill_sort_keys(conn, batch_size: int) -> int:
+    rows = conn.execute(
+        "SELECT id, title FROM games WHERE sort_key IS NULL LIMIT ?", (batch_size,)
+    ).fetchall()
+    conn.executemany(
+        "UPDATE games SET sort_key = ? WHERE id = ?",
+        [(sort_key(title), game_id) for game_id, title in rows]
+    )
+    return len(rows)
+
+
+def _create_search_index(conn):
+    """
+    Full-text index over the searchable game columns. It stores no text of its
+    own (content='games') and is kept in step with games by triggers.
+    """
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'games_fts'"
+    ).fetchone()
+    if exists:
+        return
+    conn.execute(
+        """
+        CREATE VIRTUAL TABLE games_fts USING fts5(
+            title, title_id,
+            content='games', content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2',
+            prefix='1 2 3'
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS games_fts_insert AFTER INSERT ON games BEGIN
+            INSERT INTO games_fts (rowid, title, title_id) VALUES (new.id, new.title, new.title_id);
+        END
+        """
+    )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS games_fts_delete AFTER DELETE ON games BEGIN
+            INSERT INTO games_fts (games_fts, rowid, title, title_id)
+            VALUES ('delete', old.id, old.title, old.title_id);
+        END
+        """
+    )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS games_fts_update AFTER UPDATE OF title, title_id ON games BEGIN
+            INSERT INTO games_fts (games_fts, rowid, title, title_id)
+            VALUES ('delete', old.id, old.title, old.title_id);
+            INSERT INTO games_fts (rowid, title, title_id) VALUES (new.id, new.title, new.title_id);
+        END
+        """
+    )
+    # Index the rows that are already there
+    conn.execute("INSERT INTO games_fts (games_fts) VALUES ('rebuild')")
+
+
+def _create_meta(conn):
+    # Small key/value facts about how the stored data was derived
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        )
+        """
+    )
+
+
+def _add_file_ext(conn):
+    # File extension, so the search bar's ext: filter can use an index
+    _add_missing_columns(conn, "games", {"file_ext": "TEXT"})
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_games_file_ext ON games (file_ext)")
+
+
+def _backfill_file_ext(conn, batch_size: int) -> int:
+    rows = conn.execute(
+        "SELECT id, file_path FROM games WHERE file_ext IS NULL LIMIT ?", (batch_size,)
+    ).fetchall()
+    conn.executemany(
+        "UPDATE games SET file_ext = ? WHERE id = ?",
+        [(file_extension(path), game_id) for game_id, path in rows]
+    )
+    return len(rows)
+
+
+def _create_tags(conn):
+    # User collections; a game can carry any number of tags
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS tags (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL UNIQUE COLLATE NOCASE
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS game_tags (
+            game_id INTEGER NOT NULL REFERENCES games (id) ON DELETE CASCADE,
+            tag_id INTEGER NOT NULL REFERENCES tags (id) ON DELETE CASCADE,
+            PRIMARY KEY (game_id, tag_id)
+        ) WITHOUT ROWID
+        """
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_game_tags_tag ON game_tags (tag_id, game_id)")
+    conn.executemany(
+        "INSERT OR IGNORE INTO tags (name) VALUES (?)",
+        [(name,) for name in DEFAULT_TAGS]
+    )
+
+
+def refresh_sort_keys(conn: sqlite3.Connection | None = None,
+                      batch_size: int = BACKFILL_BATCH_SIZE) -> bool:
+    """
+    Recompute every sort_key if the rules they were built with (the article
+    list) have changed, in committed batches. Returns True if a rebuild ran.
+    An interrupted rebuild is finished on the next call, since the rules are
+    only recorded once every key is current.
+    """
+    conn = conn or get_connection()
+    rules = "natural;" + ",".join(sort_articles())
+    row = conn.execute("SELECT value FROM meta WHERE key = 'sort_key_rules'").fetchone()
+    if row is not None and row[0] == rules:
+        return False
+    last_id = 0
+    while True:
+        with _transaction(conn):
+            rows = conn.execute(
+                "SELECT id, title FROM games WHERE id > ? ORDER BY id LIMIT ?",
+                (last_id, batch_size)
+            ).fetchall()
+            conn.executemany(
+                "UPDATE games SET sort_key = ? WHERE id = ?",
+                [(sort_key(title), game_id) for game_id, title in rows]
+            )
+        if not rows:
+            break
+        last_id = rows[-1][0]
+    with _transaction(conn):
+        conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('sort_key_rules', ?)", (rules,)
+        )
+    return True
+
+
+# In order; never renumber or edit a released step, add a new one instead
+MIGRATIONS = [
+    Migration(1, "games table", _create_games),
+    Migration(2, "file size, mtime and inode", _add_file_stats),
+    Migration(3, "title id, media id and header cache", _add_header_metadata),
+    Migration(4, "embedded icon flag", _add_icon_checked),
+    Migration(5, "content fingerprints", _add_fingerprints),
+    Migration(6, "scan manifest", _create_scan_manifest),
+    Migration(7, "sort key and ordering indexes", _add_sort_keys, _backfill_sort_keys),
+    Migration(8, "full-text search index", _create_search_index),
+    Migration(9, "meta table (natural sort keys are rebuilt from it)", _create_meta),
+    Migration(10, "file extension", _add_file_ext, _backfill_file_ext),
+    Migration(11, "tags", _create_tags),
+]
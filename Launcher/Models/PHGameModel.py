@@ -1,10 +1,21 @@
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 
-@dataclass
+from Launcher.Utils.PHSortKey import sort_key as make_sort_key
+
+# Slotted: no per-instance __dict__, which adds up across a 100k-game library
+@dataclass(slots=True)
 class PHGameModel:
     id: int
     title: str
     file_path: str
     cover_path: str | None
     last_played: str | None
-    play_count: int
\ No newline at end of file
+    play_count: int
+    # Title order key (games.sort_key), computed once rather than on every sort
+    sort_key: str = field(default="", compare=False, repr=False)
+
+    def __post_init__(self):
+        # Copies of the same game share one title and key string
+        self.title = sys.intern(self.title)
+        self.sort_key = sys.intern(self.sort_key or make_sort_key(self.title))
@@ -0,0 +1,253 @@
+# Launcher/Models/PHLibraryStore.py
+from bisect import bisect_left, insort
+from PySide6.QtCore import QObject, Signal
+
+from Launcher.DB import PHDatabase
+from Launcher.Models.PHGameModel import PHGameModel
+from Launcher.Models.PHTagIndex import TagIndex, bitset_ids
+
+# Ids per "WHERE id IN (...)" when re-reading games, well under SQLite's parameter limit
+READ_CHUNK_SIZE = 500
+
+
+def _order(game: PHGameModel) -> tuple:
+    # Same order as the database's (sort_key, id) index
+    return game.sort_key, game.id
+
+
+class LibraryStore(QObject):
+    """
+    The one in-memory copy of the game library, in title order. It is loaded
+    from the database once and then kept current by scans and by the mutations
+    below, which write through to PHDatabase and report each change as a signal,
+    so views and controllers never have to re-query SQLite.
+    """
+    games_added = Signal(list)    # list[PHGameModel]
+    games_removed = Signal(list)  # list[int] of game ids
+    games_changed = Signal(list)  # list[PHGameModel], updated in place
+    tags_changed = Signal()       # Tags created or deleted, or assignments changed
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._games: list[PHGameModel] = []
+        self._by_id: dict[int, PHGameModel] = {}
+        self._tags: dict[int, str] = {}
+        self._tag_index = TagIndex()
+        self._loaded = False
+
+    def games(self) -> list[PHGameModel]:
+        self._ensure_loaded()
+        return self._games
+
+    def get(self, game_id: int) -> PHGameModel | None:
+        self._ensure_loaded()
+        return self._by_id.get(game_id)
+
+    def get_file_path(self, game_id: int) -> str:
+        game = self.get(game_id)
+        return game.file_path if game and game.file_path else ""
+
+    def _ensure_loaded(self):
+        if not self._loaded:
+            self._set_games(self._read_all())
+            self._load_tags()
+            self._loaded = True
+
+    def _set_games(self, games: list[PHGameModel]):
+        # Rows arrive in index order already; sorting a sorted list is a single pass
+        self._games = sorted(games, key=_order)
+        self._by_id = {g.id: g for g in self._games}
+
+    @staticmethod
+    def _read_all() -> list[PHGameModel]:
+        rows = PHDatabase.fetch_all(
+            "SELECT id, title, file_path, cover_path, last_played, play_count, sort_key"
+            " FROM games ORDER BY sort_key, id"
+        )
+        return [PHGameModel(*row) for row in rows]
+
+    @staticmethod
+    def _read_ids(game_ids: list[int]) -> list[PHGameModel]:
+        games = []
+        for start in range(0, len(game_ids), READ_CHUNK_SIZE):
+            chunk = game_ids[start:start + READ_CHUNK_SIZE]
+            rows = PHDatabase.fetch_all(
+                "SELECT id, title, file_path, cover_path, last_played, play_count, sort_key"
+                f" FROM games WHERE id IN ({', '.join('?' * len(chunk))})",
+                chunk
+            )
+            games.extend(PHGameModel(*row) for row in rows)
+        return games
+
+    def _discard(self, game: PHGameModel):
+        # The list is in _order, so the game is found by bisection rather than a scan
+        i = bisect_left(self._games, _order(game), key=_order)
+        if i < len(self._games) and self._games[i] is game:
+            del self._games[i]
+        else:
+            self._games.remove(game)
+
+    # ─── Updates from scans ──────────────────────────────────────────────
+
+    def apply_changes(self, changed_ids, removed_ids) -> tuple[list[PHGameModel], list[int], list[PHGameModel]]:
+        """
+        Re-read just the games a scan reported editing and drop the ones it
+        deleted, keeping everything else as it is in memory.
+        Returns (added games, removed ids, changed games).
+        """
+        self._ensure_loaded()
+        removed_ids = set(removed_ids)
+        wanted = sorted(set(changed_ids) - removed_ids)
+        fresh = self._read_ids(wanted)
+        # Edited, then deleted before we got to it
+        removed_ids.update(set(wanted) - {g.id for g in fresh})
+        removed = []
+        for game_id in removed_ids:
+            game = self._by_id.pop(game_id, None)
+            if game is not None:
+                self._discard(game)
+                self._tag_index.remove_game(game_id)
+                removed.append(game_id)
+        added = []
+        changed = []
+        for game in fresh:
+            previous = self._by_id.get(game.id)
+            if previous is None:
+                added.append(game)
+            elif previous == game:
+                continue
+            else:
+                self._discard(previous)
+                changed.append(game)
+            insort(self._games, game, key=_order)
+            self._by_id[game.id] = game
+        self._emit(added, removed, changed)
+        return added, removed, changed
+
+    def reload(self) -> tuple[list[PHGameModel], list[int], list[PHGameModel]]:
+        """
+        Re-read the whole database and report what differs from memory; for a
+        full rescan, where anything may have changed. Other scans use apply_changes.
+        Returns (added games, removed ids, changed games).
+        """
+        if not self._loaded:
+            self._ensure_loaded()
+            return list(self._games), [], []
+        # Launches and covers still queued would otherwise be read back stale
+        PHDatabase.flush_writes()
+        previous = self._by_id
+        self._set_games(self._read_all())
+        added = [g for g in self._games if g.id not in previous]
+        removed = [game_id for game_id in previous if game_id not in self._by_id]
+        for game_id in removed:
+            self._tag_index.remove_game(game_id)
+        changed = [g for g in self._games if g.id in previous and previous[g.id] != g]
+        self._emit(added, removed, changed)
+        return added, removed, changed
+
+    def add_games(self, games: list[PHGameModel]) -> list[PHGameModel]:
+        """Merge games streamed from a scan; returns the ones that were new."""
+        self._ensure_loaded()
+        new_games = [g for g in games if g.id not in self._by_id]
+        for game in new_games:
+            insort(self._games, game, key=_order)
+            self._by_id[game.id] = game
+        self._emit(new_games, [], [])
+        return new_games
+
+    def _emit(self, added, removed, changed):
+        if removed:
+            self.games_removed.emit(removed)
+        if changed:
+            self.games_changed.emit(changed)
+        if added:
+            self.games_added.emit(added)
+
+    # ─── Mutations ───────────────────────────────────────────────────────
+
+    def record_launch(self, game_id: int):
+        """Count a launch; memory is updated now, the database in the background."""
+        played_at = PHDatabase.record_launch(game_id)
+        game = self.get(game_id)
+        if game is not None:
+            game.play_count = (game.play_count or 0) + 1
+            game.last_played = played_at
+            self.games_changed.emit([game])
+
+    def set_cover(self, game_id: int, cover_path: str):
+        """Set a cover image; '' removes it (and keeps embedded icons from returning)."""
+        PHDatabase.set_cover_path(game_id, cover_path)
+        game = self.get(game_id)
+        if game is not None and game.cover_path != cover_path:
+            game.cover_path = cover_path
+            self.games_changed.emit([game])
+
+    def delete_game(self, game_id: int):
+        PHDatabase.delete_game(game_id)
+        game = self._by_id.pop(game_id, None)
+        self._tag_index.remove_game(game_id)
+        if game is not None:
+            self._discard(game)
+            self.games_removed.emit([game_id])
+
+    # ─── Tags ────────────────────────────────────────────────────────────
+
+    def _load_tags(self):
+        self._tags = dict(PHDatabase.fetch_tags())
+        self._tag_index = TagIndex(PHDatabase.fetch_game_tags())
+
+    def tags(self) -> list[tuple[int, str]]:
+        """(id, name) of every tag, by name."""
+        self._ensure_loaded()
+        return sorted(self._tags.items(), key=lambda item: item[1].casefold())
+
+    def tag_count(self, tag_id: int) -> int:
+        self._ensure_loaded()
+        return self._tag_index.count(tag_id)
+
+    def tags_of(self, game_id: int) -> set[int]:
+        self._ensure_loaded()
+        return self._tag_index.tags_of(game_id)
+
+    def tagged_game_ids(self, tag_ids, match_all: bool = True) -> set[int]:
+        """Ids of the games carrying all (or any) of tag_ids."""
+        self._ensure_loaded()
+        return set(bitset_ids(self._tag_index.match(tag_ids, match_all)))
+
+    def create_tag(self, name: str) -> int:
+        self._ensure_loaded()
+        tag_id = PHDatabase.create_tag(name)
+        if tag_id not in self._tags:
+            self._tags[tag_id] = name
+            self.tags_changed.emit()
+        return tag_id
+
+    def delete_tag(self, tag_id: int):
+        self._ensure_loaded()
+        PHDatabase.delete_tag(tag_id)
+        self._tags.pop(tag_id, None)
+        self._tag_index.remove_tag(tag_id)
+        self.tags_changed.emit()
+
+    def set_game_tag(self, game_id: int, tag_id: int, tagged: bool):
+        """Tag or untag a game; memory is updated now, the database in the background."""
+        self._ensure_loaded()
+        if self._tag_index.has(tag_id, game_id) == tagged:
+            return
+        PHDatabase.set_game_tag(game_id, tag_id, tagged)
+        if tagged:
+            self._tag_index.add(tag_id, game_id)
+        else:
+            self._tag_index.discard(tag_id, game_id)
+        self.tags_changed.emit()
+
+
+_store: LibraryStore | None = None
+
+
+def library_store() -> LibraryStore:
+    """The process-wide LibraryStore, created on first use."""
+    global _store
+    if _store is None:
+        _store = LibraryStore()
+    return _store
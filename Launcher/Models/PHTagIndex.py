@@ -0,0 +1,59 @@
+# Launcher/Models/PHTagIndex.py
+
+
+def bitset_ids(bits: int) -> list[int]:
+    """The game ids set in a bitset, in ascending order."""
+    ids = []
+    digits = bin(bits)[:1:-1]  # Lowest bit first, without the '0b'
+    i = digits.find("1")
+    while i != -1:
+        ids.append(i)
+        i = digits.find("1", i + 1)
+    return ids
+
+
+class TagIndex:
+    """
+    One bitset per tag, with bit n set when game id n carries the tag. Game ids
+    are small and dense, so a Python int is a compact bitmap, and combining tags
+    is a handful of whole-bitmap AND/OR operations instead of per-row joins.
+    """
+
+    def __init__(self, assignments=()):
+        self._bits: dict[int, int] = {}
+        for tag_id, game_id in assignments:
+            self.add(tag_id, game_id)
+
+    def add(self, tag_id: int, game_id: int):
+        self._bits[tag_id] = self._bits.get(tag_id, 0) | (1 << game_id)
+
+    def discard(self, tag_id: int, game_id: int):
+        if tag_id in self._bits:
+            self._bits[tag_id] &= ~(1 << game_id)
+
+    def has(self, tag_id: int, game_id: int) -> bool:
+        return bool(self._bits.get(tag_id, 0) >> game_id & 1)
+
+    def tags_of(self, game_id: int) -> set[int]:
+        return {tag_id for tag_id, bits in self._bits.items() if bits >> game_id & 1}
+
+    def count(self, tag_id: int) -> int:
+        return self._bits.get(tag_id, 0).bit_count()
+
+    def remove_game(self, game_id: int):
+        mask = ~(1 << game_id)
+        for tag_id in self._bits:
+            self._bits[tag_id] &= mask
+
+    def remove_tag(self, tag_id: int):
+        self._bits.pop(tag_id, None)
+
+    def match(self, tag_ids, match_all: bool = True) -> int:
+        """Bitset of the games carrying all (or any) of tag_ids."""
+        bitsets = [self._bits.get(tag_id, 0) for tag_id in tag_ids]
+        if not bitsets:
+            return 0
+        result = bitsets[0]
+        for bits in bitsets[1:]:
+            result = result & bits if match_all else result | bits
+        return result
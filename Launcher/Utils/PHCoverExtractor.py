@@ -0,0 +1,163 @@
+# Launcher/Utils/PHCoverExtractor.py
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from Launcher.DB import PHDatabase
+
+# Managed directory for covers pulled out of game files
+COVER_DIR = Path.home() / ".perch" / "covers"
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+STFS_MAGICS = (b"CON ", b"LIVE", b"PIRS")
+STFS_METADATA_VERSION_OFFSET = 0x348
+STFS_THUMBNAIL_SIZES_OFFSET = 0x1712
+STFS_THUMBNAIL_OFFSET = 0x171A
+# The title thumbnail moved when metadata version 2 shrank the image slots
+STFS_TITLE_THUMBNAIL_OFFSETS = {1: 0x571A, 2: 0x541A}
+
+XEX_HEADER_RESOURCE_INFO = 0x000002FF
+XEX_HEADER_FILE_FORMAT_INFO = 0x000003FF
+XEX_HEADER_IMAGE_BASE_ADDRESS = 0x00010201
+XDBF_MAGIC = b"XDBF"
+XDBF_NAMESPACE_IMAGE = 2
+XDBF_TITLE_ICON_ID = 0x8000
+
+# Rows handled (and committed) per round, so an interrupted run resumes where it stopped
+EXTRACT_CHUNK_SIZE = 32
+
+
+def extract_title_icon(file_path: str) -> bytes | None:
+    """
+    Return the PNG title icon embedded in an STFS package or an unencrypted,
+    uncompressed XEX, reading only the header and the icon itself.
+    """
+    try:
+        with open(file_path, "rb") as f:
+            magic = f.read(4)
+            if magic in STFS_MAGICS:
+                return _read_stfs_icon(f)
+            if magic == b"XEX2":
+                return _read_xex_icon(f)
+    except (OSError, struct.error):
+        pass
+    return None
+
+
+def _read_at(f, offset: int, size: int) -> bytes:
+    f.seek(offset)
+    data = f.read(size)
+    if len(data) != size:
+        raise struct.error("unexpected end of file")
+    return data
+
+
+def _png_or_none(data: bytes) -> bytes | None:
+    return data if data.startswith(PNG_SIGNATURE) else None
+
+
+def _read_stfs_icon(f) -> bytes | None:
+    version = struct.unpack(">I", _read_at(f, STFS_METADATA_VERSION_OFFSET, 4))[0]
+    thumb_size, title_thumb_size = struct.unpack(">II", _read_at(f, STFS_THUMBNAIL_SIZES_OFFSET, 8))
+    title_offset = STFS_TITLE_THUMBNAIL_OFFSETS.get(version, STFS_TITLE_THUMBNAIL_OFFSETS[1])
+    # Prefer the game's own icon over the package thumbnail
+    for offset, size in ((title_offset, title_thumb_size), (STFS_THUMBNAIL_OFFSET, thumb_size)):
+        if 0 < size <= 0x4000:
+            icon = _png_or_none(_read_at(f, offset, size))
+            if icon:
+                return icon
+    return None
+
+
+def _read_xex_icon(f) -> bytes | None:
+    pe_offset, _, _, header_count = struct.unpack(">IIII", _read_at(f, 0x8, 16))
+    headers = {}
+    for i in range(min(header_count, 64)):
+        key, value = struct.unpack(">II", _read_at(f, 0x18 + i * 8, 8))
+        headers[key] = value
+    if XEX_HEADER_RESOURCE_INFO not in headers or XEX_HEADER_FILE_FORMAT_INFO not in headers:
+        return None
+    # Retail images are encrypted and/or compressed; their resources can't be read in place
+    encryption, compression = struct.unpack(">HH", _read_at(f, headers[XEX_HEADER_FILE_FORMAT_INFO] + 4, 4))
+    if encryption != 0 or compression != 0:
+        return None
+    image_base = headers.get(XEX_HEADER_IMAGE_BASE_ADDRESS, 0)
+
+    info_offset = headers[XEX_HEADER_RESOURCE_INFO]
+    info_size = struct.unpack(">I", _read_at(f, info_offset, 4))[0]
+    for i in range((info_size - 4) // 16):
+        _, address, size = struct.unpack(">8sII", _read_at(f, info_offset + 4 + i * 16, 16))
+        icon = _read_xdbf_icon(f, pe_offset + address - image_base, size)
+        if icon:
+            return icon
+    return None
+
+
+def _read_xdbf_icon(f, base: int, size: int) -> bytes | None:
+    """Find the title icon image in an XDBF (SPA) resource blob."""
+    if size < 0x18 or _read_at(f, base, 4) != XDBF_MAGIC:
+        return None
+    _, table_len, entry_count, free_len, _ = struct.unpack(">IIIII", _read_at(f, base + 4, 20))
+    data_start = base + 0x18 + table_len * 0x12 + free_len * 8
+    for i in range(min(entry_count, table_len)):
+        namespace, entry_id, offset, length = struct.unpack(
+            ">HQII", _read_at(f, base + 0x18 + i * 0x12, 0x12)
+        )
+        if namespace == XDBF_NAMESPACE_IMAGE and entry_id == XDBF_TITLE_ICON_ID:
+            return _png_or_none(_read_at(f, data_start + offset, length))
+    return None
+
+
+def _extract_to_cover_dir(row) -> tuple[int, str | None]:
+    game_id, file_path, title_id = row
+    icon = extract_title_icon(file_path)
+    if icon is None:
+        return game_id, None
+    # Copies of the same title share one cover file
+    cover = COVER_DIR / f"{title_id or f'game-{game_id}'}.png"
+    try:
+        if not cover.exists():
+            cover.write_bytes(icon)
+    except OSError:
+        # Read-only or full disk; leave this game without a cover
+        return game_id, None
+    return game_id, str(cover)
+
+
+def extract_missing_covers(cancel_event: threading.Event | None = None, max_workers: int = 4,
+                           changed_ids: set | None = None) -> int:
+    """
+    Fill cover_path from embedded icons for games that have never had a cover
+    (a cover removed by the user is stored as '' and left alone). Each file is
+    only tried once; rows are processed in committed chunks on a thread pool,
+    so stopping part-way loses nothing. Returns the number of covers set, adding
+    their ids to changed_ids if given.
+    """
+    COVER_DIR.mkdir(parents=True, exist_ok=True)
+    covers_set = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        while cancel_event is None or not cancel_event.is_set():
+            rows = PHDatabase.fetch_all(
+                """
+                SELECT id, file_path, title_id
+                  FROM games
+                 WHERE cover_path IS NULL AND icon_checked = 0
+                   AND (lower(file_path) LIKE '%.stfs' OR lower(file_path) LIKE '%.xex')
+                 LIMIT ?
+                """,
+                (EXTRACT_CHUNK_SIZE,)
+            )
+            if not rows:
+                break
+            results = list(pool.map(_extract_to_cover_dir, rows))
+            # A cover the user set since the SELECT above wins
+            PHDatabase.executemany(
+                "UPDATE games SET cover_path = ?, icon_checked = 1 WHERE id = ? AND cover_path IS NULL",
+                [(cover, game_id) for game_id, cover in results]
+            )
+            covers_set += sum(1 for _, cover in results if cover)
+            if changed_ids is not None:
+                # A game the user gave a cover meanwhile is re-read unchanged; harmless
+                changed_ids.update(game_id for game_id, cover in results if cover)
+    return covers_set
@@ -0,0 +1,112 @@
+# Launcher/Utils/PHCoverLoader.py
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QSize, Qt, Signal
+from PySide6.QtGui import QImage, QImageReader
+
+from Launcher.Utils.PHThumbnailCache import ThumbnailCache, thumbnail_cache
+
+# Threads decoding covers; separate from the global pool so a scan can't starve them
+DEFAULT_DECODE_THREADS = 4
+
+
+def decode_cover(path: str, size: QSize) -> QImage:
+    """
+    Read an image scaled to fit size, keeping its aspect ratio; a null QImage if it
+    can't be read. Formats that support it (JPEG) are decoded straight at the
+    smaller size instead of decoding full-size and scaling down afterwards.
+    """
+    reader = QImageReader(path)
+    reader.setAutoTransform(True)
+    source_size = reader.size()
+    if source_size.isValid():
+        reader.setScaledSize(source_size.scaled(size, Qt.KeepAspectRatio))
+    image = reader.read()
+    if not image.isNull() and not source_size.isValid():
+        # The header didn't give a size up front; scale after decoding
+        image = image.scaled(size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    return image
+
+
+class CoverLoadSignals(QObject):
+    """Signals for CoverLoadTask (a QRunnable cannot declare signals itself)."""
+    finished = Signal(object, QImage)  # request key, decoded image
+
+
+class CoverLoadTask(QRunnable):
+    """
+    Loads one cover on a pool thread unless cancelled before it starts: from the
+    thumbnail cache if it has it, otherwise decoded from the original and cached.
+    """
+
+    def __init__(self, key, path: str, size: QSize, dpr: float,
+                 thumbnails: ThumbnailCache, signals: CoverLoadSignals):
+        super().__init__()
+        self.key = key
+        self.path = path
+        self.size = size
+        self.dpr = dpr
+        self.thumbnails = thumbnails
+        self.signals = signals
+        self.cancelled = False
+
+    def run(self):
+        if self.cancelled:
+            return
+        image = self.thumbnails.load(self.path, self.size, self.dpr)
+        if image is None:
+            image = decode_cover(self.path, self.size)
+            self.thumbnails.store(self.path, self.size, self.dpr, image)
+        if not self.cancelled:
+            self.signals.finished.emit(self.key, image)
+
+
+class CoverLoader(QObject):
+    """
+    Decodes cover images off the GUI thread. Views request a cover under a key of
+    their choosing and get it back through cover_loaded; requests for cells that
+    have scrolled away can be cancelled before they are decoded.
+    """
+    cover_loaded = Signal(object, QImage)  # request key, image (null if unreadable)
+
+    def __init__(self, max_threads: int = DEFAULT_DECODE_THREADS, parent=None):
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max_threads)
+        # Created on the GUI thread, so results are delivered back to it
+        self._signals = CoverLoadSignals()
+        self._signals.finished.connect(self._on_finished)
+        self._pending: dict[object, CoverLoadTask] = {}
+        self._thumbnails = thumbnail_cache()
+
+    def request(self, key, path: str, size: QSize, dpr: float = 1.0):
+        """
+        Load path scaled to fit size (in device pixels, for a screen of the given
+        device pixel ratio), unless already queued.
+        """
+        if key in self._pending:
+            return
+        task = CoverLoadTask(key, path, size, dpr, self._thumbnails, self._signals)
+        self._pending[key] = task
+        self._pool.start(task)
+
+    def is_pending(self, key) -> bool:
+        return key in self._pending
+
+    def cancel(self, key):
+        task = self._pending.pop(key, None)
+        if task is not None:
+            task.cancelled = True
+
+    def _on_finished(self, key, image: QImage):
+        if self._pending.pop(key, None) is not None:
+            self.cover_loaded.emit(key, image)
+
+
+_loader: CoverLoader | None = None
+
+
+def cover_loader() -> CoverLoader:
+    """The process-wide CoverLoader, created on first use."""
+    global _loader
+    if _loader is None:
+        _loader = CoverLoader()
+    return _loader
@@ -0,0 +1,69 @@
+# Launcher/Utils/PHFingerprint.py
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from Launcher.DB import PHDatabase
+
+# Bytes hashed from each sample window (head, middle, tail)
+SAMPLE_SIZE = 64 * 1024
+# Rows fingerprinted (and committed) per round, so an interrupted run resumes where it stopped
+FINGERPRINT_CHUNK_SIZE = 64
+
+
+def compute_fingerprint(file_path: str, size: int) -> str | None:
+    """
+    Identify a file's content from its size plus a hash of three fixed sample
+    windows, so multi-GB images are never read in full. Copies of the same image
+    get the same fingerprint wherever they live.
+    """
+    digest = hashlib.blake2b(size.to_bytes(8, "little"), digest_size=16)
+    if size <= SAMPLE_SIZE * 3:
+        offsets = [0]
+        length = size
+    else:
+        offsets = [0, (size - SAMPLE_SIZE) // 2, size - SAMPLE_SIZE]
+        length = SAMPLE_SIZE
+    try:
+        with open(file_path, "rb") as f:
+            for offset in offsets:
+                f.seek(offset)
+                digest.update(f.read(length))
+    except OSError:
+        return None
+    return f"{size:x}-{digest.hexdigest()}"
+
+
+def _fingerprint_row(row) -> tuple:
+    game_id, file_path, size, mtime = row
+    return compute_fingerprint(file_path, size), size, mtime, game_id
+
+
+def update_fingerprints(cancel_event: threading.Event | None = None, max_workers: int = 4) -> int:
+    """
+    Fingerprint every game whose cached fingerprint doesn't match its current
+    (size, mtime), on a thread pool, committing after each chunk.
+    Returns the number of rows updated.
+    """
+    updated = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        while cancel_event is None or not cancel_event.is_set():
+            rows = PHDatabase.fetch_all(
+                """
+                SELECT id, file_path, file_size, file_mtime
+                  FROM games
+                 WHERE file_size IS NOT NULL
+                   AND (fp_size IS NOT file_size OR fp_mtime IS NOT file_mtime)
+                 LIMIT ?
+                """,
+                (FINGERPRINT_CHUNK_SIZE,)
+            )
+            if not rows:
+                break
+            results = list(pool.map(_fingerprint_row, rows))
+            PHDatabase.executemany(
+                "UPDATE games SET fingerprint = ?, fp_size = ?, fp_mtime = ? WHERE id = ?",
+                results
+            )
+            updated += len(results)
+    return updated
@@ -0,0 +1,175 @@
+# Launcher/Utils/PHGameMetadata.py
+import mmap
+import struct
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+from Launcher.DB import PHDatabase
+from Launcher.Utils.PHSortKey import sort_key
+
+SECTOR_SIZE = 0x800
+# Where the XDVDFS game partition can start inside an Xbox 360 image
+# (plain extract, trimmed, XGD3, XGD2, XGD1)
+XDVDFS_PARTITION_OFFSETS = (0x0, 0xFB20 * SECTOR_SIZE, 0x2080000, 0xFD90000, 0x20600 * SECTOR_SIZE, 0x18300000)
+XDVDFS_MAGIC = b"MICROSOFT*XBOX*MEDIA"
+XEX2_MAGIC = b"XEX2"
+XEX_HEADER_EXECUTION_INFO = 0x00040006
+STFS_MAGICS = (b"CON ", b"LIVE", b"PIRS")
+STFS_TITLE_NAME_OFFSET = 0x1691
+STFS_DISPLAY_NAME_OFFSET = 0x411
+STFS_NAME_SIZE = 0x80
+
+
+@dataclass
+class GameMetadata:
+    """Identity read from a game file's headers; any field may be missing."""
+    title_id: str | None = None
+    media_id: str | None = None
+    display_name: str | None = None
+
+
+def default_title(file_path: str) -> str:
+    """
+    Title to use before (or without) header metadata: the file name, except for
+    extracted games whose executable is always default.xex, where the folder name
+    is what the user recognises.
+    """
+    path = Path(file_path)
+    if path.stem.lower() == "default" and path.parent.name:
+        return path.parent.name
+    return path.stem
+
+
+def file_extension(file_path: str) -> str:
+    """Lower-case extension without the dot, as stored in games.file_ext ('' if none)."""
+    return Path(file_path).suffix.lstrip(".").lower()
+
+
+def read_game_metadata(file_path: str) -> GameMetadata | None:
+    """
+    Parse title ID, media ID and display name from an ISO, XEX or STFS file.
+    The file is memory-mapped so only the few header pages that are looked at
+    are actually read from disk. Returns None if the format isn't recognised.
+    """
+    try:
+        with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            head = mm[:4]
+            if head == XEX2_MAGIC:
+                return _parse_xex(mm, 0)
+            if head in STFS_MAGICS:
+                return _parse_stfs(mm)
+            if file_path.lower().endswith(".iso"):
+                return _parse_iso(mm)
+    except (OSError, ValueError, struct.error):
+        # ValueError: empty file (cannot be mapped) or a truncated header
+        pass
+    return None
+
+
+def _parse_xex(mm, base: int) -> GameMetadata | None:
+    """Read the execution-info optional header of a XEX2 image starting at base."""
+    if mm[base:base + 4] != XEX2_MAGIC:
+        return None
+    header_count = struct.unpack_from(">I", mm, base + 0x14)[0]
+    for i in range(min(header_count, 64)):
+        key, value = struct.unpack_from(">II", mm, base + 0x18 + i * 8)
+        if key == XEX_HEADER_EXECUTION_INFO:
+            media_id, _, _, title_id = struct.unpack_from(">IIII", mm, base + value)
+            return GameMetadata(title_id=f"{title_id:08X}", media_id=f"{media_id:08X}")
+    return GameMetadata()
+
+
+def _parse_stfs(mm) -> GameMetadata:
+    """Read the XContent header shared by CON/LIVE/PIRS packages."""
+    media_id = struct.unpack_from(">I", mm, 0x354)[0]
+    title_id = struct.unpack_from(">I", mm, 0x360)[0]
+    name = (_read_utf16(mm, STFS_TITLE_NAME_OFFSET, STFS_NAME_SIZE)
+            or _read_utf16(mm, STFS_DISPLAY_NAME_OFFSET, STFS_NAME_SIZE))
+    return GameMetadata(
+        title_id=f"{title_id:08X}" if title_id else None,
+        media_id=f"{media_id:08X}" if media_id else None,
+        display_name=name,
+    )
+
+
+def _parse_iso(mm) -> GameMetadata | None:
+    """Locate the XDVDFS volume and parse the default.xex in its root directory."""
+    for partition in XDVDFS_PARTITION_OFFSETS:
+        descriptor = partition + 32 * SECTOR_SIZE
+        if mm[descriptor:descriptor + len(XDVDFS_MAGIC)] != XDVDFS_MAGIC:
+            continue
+        root_sector, root_size = struct.unpack_from("<II", mm, descriptor + 0x14)
+        entry = _find_xdvdfs_entry(mm, partition + root_sector * SECTOR_SIZE, root_size, b"default.xex")
+        if entry is None:
+            return GameMetadata()
+        return _parse_xex(mm, partition + entry * SECTOR_SIZE)
+    return None
+
+
+def _find_xdvdfs_entry(mm, table: int, table_size: int, name: bytes) -> int | None:
+    """Walk an XDVDFS directory tree and return the start sector of the named file."""
+    wanted = name.lower()
+    pending = [0]
+    seen = set()
+    while pending:
+        offset = pending.pop()
+        if offset in seen or offset + 14 > table_size:
+            continue
+        seen.add(offset)
+        left, right, sector, _, _, name_len = struct.unpack_from("<HHIIBB", mm, table + offset)
+        if left == 0xFFFF:
+            continue  # Padding at the end of a sector
+        entry_name = mm[table + offset + 14:table + offset + 14 + name_len]
+        if entry_name.lower() == wanted:
+            return sector
+        if left:
+            pending.append(left * 4)
+        if right:
+            pending.append(right * 4)
+    return None
+
+
+def _read_utf16(mm, offset: int, size: int) -> str | None:
+    text = mm[offset:offset + size].decode("utf-16-be", errors="ignore").split("\x00", 1)[0]
+    return text.strip() or None
+
+
+def update_library_metadata(cancel_event: threading.Event | None = None,
+                            changed_ids: set | None = None) -> int:
+    """
+    Parse headers for every game whose cached metadata doesn't match its current
+    (size, mtime), so each file is read at most once per change. Titles still set
+    to the file-name default are replaced by the name found in the header.
+    Returns the number of titles changed, adding their ids to changed_ids if given.
+    """
+    pending = PHDatabase.fetch_all(
+        """
+        SELECT id, title, file_path, file_size, file_mtime
+          FROM games
+         WHERE file_size IS NOT NULL
+           AND (meta_size IS NOT file_size OR meta_mtime IS NOT file_mtime)
+        """
+    )
+    titles_changed = 0
+    updates = []
+    for game_id, title, file_path, size, mtime in pending:
+        if cancel_event is not None and cancel_event.is_set():
+            break
+        meta = read_game_metadata(file_path) or GameMetadata()
+        if meta.display_name and title in (default_title(file_path), Path(file_path).stem):
+            if meta.display_name != title:
+                title = meta.display_name
+                titles_changed += 1
+                if changed_ids is not None:
+                    changed_ids.add(game_id)
+        updates.append((title, sort_key(title), meta.title_id, meta.media_id, size, mtime, game_id))
+    PHDatabase.executemany(
+        """
+        UPDATE games
+           SET title = ?, sort_key = ?, title_id = ?, media_id = ?, meta_size = ?, meta_mtime = ?
+         WHERE id = ?
+        """,
+        updates
+    )
+    return titles_changed
@@ -0,0 +1,399 @@
+# Launcher/Utils/PHLibraryScanner.py
+import os
+import queue
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Callable
+
+from Launcher.DB import PHDatabase
+from Launcher.Models.PHGameModel import PHGameModel
+from Launcher.Utils.PHGameMetadata import default_title, file_extension
+from Launcher.Utils.PHSortKey import sort_key
+
+# File extensions recognised as games when scanning folders
+GAME_EXTENSIONS = ('.iso', '.xex', '.elf', '.stfs')
+# Default number of scan roots (devices) walked at the same time
+DEFAULT_CONCURRENCY = 4
+# Manifest mtime of a directory whose listing failed; never matches, so it is listed again
+UNLISTED_MTIME = -1
+
+
+@dataclass
+class ScanStats:
+    """Counters describing how much work a scan did."""
+    dirs_visited: int = 0
+    dirs_listed: int = 0
+    files_matched: int = 0
+    rows_inserted: int = 0
+    rows_removed: int = 0
+    rows_relinked: int = 0
+    # Rows kept although their file is gone, because their whole root looks unmounted
+    rows_kept_missing: int = 0
+    titles_updated: int = 0
+    covers_extracted: int = 0
+    fingerprints_updated: int = 0
+    cancelled: bool = False
+    # Set when the scan or a post-scan stage raised; error holds the message
+    failed: bool = False
+    error: str = ""
+    # Rows edited after they were reported as new or loaded (moved, retitled, given
+    # a cover) and rows deleted, so the in-memory library can update just those
+    changed_ids: set = field(default_factory=set)
+    removed_ids: set = field(default_factory=set)
+
+    def __str__(self) -> str:
+        text = (f"{self.dirs_visited} folders visited ({self.dirs_listed} listed), "
+                f"{self.files_matched} game files matched, {self.rows_inserted} new, "
+                f"{self.rows_relinked} moved, {self.rows_removed} removed")
+        if self.rows_kept_missing:
+            text += f", {self.rows_kept_missing} kept (folder empty, drive unmounted?)"
+        return text
+
+
+@dataclass
+class _DirResult:
+    """What a walker thread found in one directory, handed to the writer."""
+    dir_path: str
+    listed: bool
+    failed: bool = False
+    games: list = field(default_factory=list)
+    update: tuple | None = None
+    stale: set = field(default_factory=set)
+
+
+class LibraryScanner:
+    """
+    Walks each scan root once with os.scandir, matching every game extension
+    in the same pass, and writes new rows with executemany in batched transactions.
+
+    Directories whose mtime matches their scan_manifest entry are not re-listed;
+    only their known subdirectories are visited, so a nested change is still found.
+
+    Roots are grouped by device and each group is walked by its own thread (at most
+    `concurrency` at once), so a slow network mount doesn't hold up a local SSD while
+    roots sharing one disk are still read one after another. Walkers only read the
+    file system; the thread calling scan() is the single writer to the database.
+
+    After a complete walk, rows under a reachable root whose file is gone are
+    removed, unless that would empty the root (most likely an unmounted drive's
+    mountpoint). A new file with the same size and inode or file name as a vanished
+    one is treated as a move: the old row takes the new path, keeping its id,
+    cover, play_count and last_played.
+    """
+
+    def __init__(self, roots: list[Path], extensions: tuple[str, ...] = GAME_EXTENSIONS,
+                 batch_size: int = 200, concurrency: int = DEFAULT_CONCURRENCY):
+        self.roots = roots
+        self.extensions = tuple(ext.lower() for ext in extensions)
+        self.batch_size = batch_size
+        self.concurrency = max(1, concurrency)
+
+    def scan(self, force_full: bool = False,
+             cancel_event: threading.Event | None = None,
+             on_batch: Callable[[list[PHGameModel]], None] | None = None,
+             on_progress: Callable[[ScanStats], None] | None = None) -> ScanStats:
+        """
+        Scan all roots; force_full ignores the manifest and re-lists everything.
+
+        New games are committed every batch_size matches and, if on_batch is given,
+        handed over as PHGameModel rows. Setting cancel_event stops the walk after the
+        current directory; games already found are kept but the manifest is left
+        untouched so the next scan re-lists whatever was missed.
+        """
+        cancel_event = cancel_event or threading.Event()
+        stats = ScanStats()
+        if force_full:
+            manifest = {}
+        else:
+            rows = PHDatabase.fetch_all("SELECT dir_path, mtime, entry_count FROM scan_manifest")
+            manifest = {row[0]: (row[1], row[2]) for row in rows}
+
+        # Map each manifest directory to its known subdirectories
+        children = {}
+        for dir_path in manifest:
+            children.setdefault(os.path.dirname(dir_path), []).append(dir_path)
+
+        games = []
+        updates = []
+        stale = set()
+        listed = set()    # Directories listed successfully
+        visited = set()   # Directories reached, listed or not
+        failed = set()    # Directories that could not be read
+        found = set()     # Game files seen in listed directories
+        inserted = []     # (id, file_path, file_size, file_inode) added this scan
+        groups = self._group_roots_by_device()
+        results = queue.Queue()
+        with ThreadPoolExecutor(max_workers=max(1, min(self.concurrency, len(groups)))) as pool:
+            futures = [
+                pool.submit(self._walk_roots, roots, manifest, children, cancel_event, results)
+                for roots in groups
+            ]
+            running = len(futures)
+            while running:
+                result = results.get()
+                if result is None:
+                    running -= 1
+                    continue
+                if result.failed:
+                    failed.add(result.dir_path)
+                    if not result.listed:
+                        continue
+                stats.dirs_visited += 1
+                visited.add(result.dir_path)
+                if result.listed:
+                    stats.dirs_listed += 1
+                    games.extend(result.games)
+                    found.update(game[1] for game in result.games)
+                    if result.update is not None:
+                        if not result.failed:
+                            listed.add(result.dir_path)
+                        updates.append(result.update)
+                        stale.update(result.stale)
+                if len(games) >= self.batch_size:
+                    self._insert_games(games, stats, on_batch, inserted)
+                if on_progress is not None:
+                    on_progress(replace(stats, files_matched=stats.files_matched + len(games)))
+            for future in futures:
+                future.result()  # Re-raise anything unexpected from a walker
+        stats.cancelled = cancel_event.is_set()
+
+        self._insert_games(games, stats, on_batch, inserted)
+        if stats.cancelled:
+            return stats
+        roots = [root for group in groups for root in group]
+        self._prune_vanished(stats, roots, listed, visited, failed, found, inserted)
+        # The manifest is only written once the whole walk has completed, so a
+        # recorded directory always has its subdirectories recorded as well
+        with PHDatabase.transaction():
+            if force_full:
+                PHDatabase.execute("DELETE FROM scan_manifest")
+            elif stale:
+                gone = [d for d in manifest
+                        if d in stale or any(d.startswith(s + os.sep) for s in stale)]
+                PHDatabase.executemany(
+                    "DELETE FROM scan_manifest WHERE dir_path = ?",
+                    [(d,) for d in gone]
+                )
+            PHDatabase.executemany(
+                "INSERT OR REPLACE INTO scan_manifest (dir_path, mtime, entry_count) VALUES (?, ?, ?)",
+                updates
+            )
+        return stats
+
+    def _group_roots_by_device(self) -> list[list[str]]:
+        """Group existing roots by st_dev so each physical device gets one walker."""
+        groups = {}
+        for root in self.roots:
+            try:
+                device = os.stat(root).st_dev
+            except OSError:
+                continue  # Missing or unreachable root
+            groups.setdefault(device, []).append(str(root))
+        return list(groups.values())
+
+    def _walk_roots(self, roots: list[str], manifest: dict, children: dict,
+                    cancel_event: threading.Event, results: queue.Queue) -> None:
+        """Walker thread: visit every directory under roots and queue a _DirResult for each."""
+        try:
+            for root in roots:
+                pending = [root]
+                while pending and not cancel_event.is_set():
+                    dir_path = pending.pop()
+                    try:
+                        mtime = os.stat(dir_path).st_mtime_ns
+                    except OSError:
+                        results.put(_DirResult(dir_path, listed=False, failed=True))
+                        continue
+                    known = manifest.get(dir_path)
+                    if known and known[0] == mtime:
+                        # Unchanged: no need to list it, but descend into known subfolders
+                        pending.extend(children.get(dir_path, []))
+                        results.put(_DirResult(dir_path, listed=False))
+                        continue
+                    games = []
+                    subdirs, entry_count = self._list_directory(dir_path, games)
+                    pending.extend(subdirs)
+                    if entry_count is None:
+                        # Listing failed part-way: keep what it found, and record it as
+                        # unlisted so the next scan descends into it and lists it again
+                        results.put(_DirResult(dir_path, listed=True, failed=True, games=games,
+                                               update=(dir_path, UNLISTED_MTIME, 0)))
+                        continue
+                    results.put(_DirResult(
+                        dir_path,
+                        listed=True,
+                        games=games,
+                        update=(dir_path, mtime, entry_count),
+                        # Forget subfolders that no longer exist
+                        stale=set(children.get(dir_path, [])) - set(subdirs),
+                    ))
+        finally:
+            results.put(None)
+
+    def _insert_games(self, games: list, stats: ScanStats, on_batch, inserted: list) -> None:
+        """
+        Insert pending game rows in one transaction, refresh the stored size/mtime
+        of files already known, and report the newly added rows.
+        """
+        if not games:
+            return
+        stats.files_matched += len(games)
+        last_id = PHDatabase.fetch_one("SELECT COALESCE(MAX(id), 0) FROM games")[0]
+        with PHDatabase.transaction():
+            cursor = PHDatabase.executemany(
+                "INSERT OR IGNORE INTO games"
+                " (title, sort_key, file_path, file_ext, file_size, file_mtime, file_inode)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(title, sort_key(title), path, file_extension(path), *file_stats)
+                 for title, path, *file_stats in games]
+            )
+            new_count = max(cursor.rowcount, 0)
+            PHDatabase.executemany(
+                """
+                UPDATE games
+                   SET file_size = ?, file_mtime = ?, file_inode = ?
+                 WHERE file_path = ?
+                   AND (file_size IS NOT ? OR file_mtime IS NOT ? OR file_inode IS NOT ?)
+                """,
+                [(size, mtime, inode, path, size, mtime, inode)
+                 for _, path, size, mtime, inode in games]
+            )
+        stats.rows_inserted += new_count
+        games.clear()
+        if not new_count:
+            return
+        rows = PHDatabase.fetch_all(
+            "SELECT id, title, file_path, cover_path, last_played, play_count, file_size, file_inode"
+            " FROM games WHERE id > ? ORDER BY id",
+            (last_id,)
+        )
+        inserted.extend((row[0], row[2], row[6], row[7]) for row in rows)
+        if on_batch is not None:
+            on_batch([PHGameModel(*row[:6]) for row in rows])
+
+    def _prune_vanished(self, stats: ScanStats, roots: list[str], listed: set,
+                        visited: set, failed: set, found: set, inserted: list) -> None:
+        """
+        Remove rows whose file has disappeared from under a reachable root, re-linking
+        those that reappeared elsewhere. Only rows in directories that were listed or
+        have vanished are considered, and each candidate is confirmed missing on disk,
+        so games added by hand outside the scanned extensions are left alone.
+
+        A root that would lose every one of its games is taken to be an unmounted
+        drive whose empty mountpoint is still there: its rows may be re-linked but
+        are never removed, so play counts, covers and tags survive until it is back.
+        """
+        if not roots:
+            return
+        # Longest first, so a game is counted under the innermost root holding it
+        root_prefixes = sorted({root.rstrip(os.sep) + os.sep for root in roots}, key=len, reverse=True)
+        failed_prefixes = tuple(d + os.sep for d in failed)
+        root_rows = dict.fromkeys(root_prefixes, 0)
+        vanished = []
+        rows = PHDatabase.fetch_all("SELECT id, file_path, file_size, file_inode FROM games")
+        for game_id, path, size, inode in rows:
+            root = next((prefix for prefix in root_prefixes if path.startswith(prefix)), None)
+            if root is None:
+                continue
+            root_rows[root] += 1
+            if path in found:
+                continue
+            if failed_prefixes and path.startswith(failed_prefixes):
+                continue  # Couldn't look; assume it is still there
+            parent = os.path.dirname(path)
+            if parent in visited and parent not in listed:
+                continue  # Directory unchanged since the last scan
+            if os.path.lexists(path):
+                continue
+            vanished.append((game_id, path, size, inode, root))
+        if not vanished:
+            return
+        root_losses = Counter(root for *_, root in vanished)
+        unmounted = {root for root, lost in root_losses.items() if lost == root_rows[root]}
+
+        # Index the files that showed up this scan by size for move detection
+        new_by_size = {}
+        for new_id, new_path, new_size, new_inode in inserted:
+            if new_size is not None:
+                new_by_size.setdefault(new_size, []).append((new_id, new_path, new_inode))
+
+        relinks = []
+        removed = []
+        for game_id, path, size, inode, root in vanished:
+            match = None
+            for candidate in new_by_size.get(size, []):
+                _, new_path, new_inode = candidate
+                same_inode = inode is not None and inode == new_inode
+                same_name = os.path.basename(path).lower() == os.path.basename(new_path).lower()
+                if same_inode or same_name:
+                    match = candidate
+                    break
+            if match is None:
+                if root in unmounted:
+                    stats.rows_kept_missing += 1
+                else:
+                    removed.append((game_id,))
+                continue
+            new_by_size[size].remove(match)
+            relinks.append((game_id, match[0], match[1]))
+
+        with PHDatabase.transaction():
+            for old_id, new_id, new_path in relinks:
+                # Fold the freshly inserted row back into the original one
+                title, key, size, mtime, inode = PHDatabase.fetch_one(
+                    "SELECT title, sort_key, file_size, file_mtime, file_inode FROM games WHERE id = ?",
+                    (new_id,)
+                )
+                PHDatabase.execute("DELETE FROM games WHERE id = ?", (new_id,))
+                PHDatabase.execute(
+                    """
+                    UPDATE games
+                       SET title = ?, sort_key = ?, file_path = ?, file_ext = ?,
+                           file_size = ?, file_mtime = ?, file_inode = ?
+                     WHERE id = ?
+                    """,
+                    (title, key, new_path, file_extension(new_path), size, mtime, inode, old_id)
+                )
+            PHDatabase.executemany("DELETE FROM games WHERE id = ?", removed)
+        stats.rows_relinked += len(relinks)
+        stats.rows_removed += len(removed)
+        stats.changed_ids.update(old_id for old_id, _, _ in relinks)
+        # The row inserted for a moved file was folded back into the original
+        stats.removed_ids.update(new_id for _, new_id, _ in relinks)
+        stats.removed_ids.update(game_id for (game_id,) in removed)
+        # A relinked file was counted as new when it was inserted
+        stats.rows_inserted -= len(relinks)
+
+    def _list_directory(self, dir_path: str, games: list) -> tuple[list[str], int | None]:
+        """
+        List a single directory, appending (title, path, size, mtime, inode) for each
+        game file to games.
+        Returns (subdirectory paths, number of entries); the count is None if the
+        directory could not be read.
+        """
+        subdirs = []
+        entry_count = 0
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    entry_count += 1
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                            continue
+                    except OSError:
+                        continue
+                    if entry.name.lower().endswith(self.extensions):
+                        try:
+                            st = entry.stat()
+                            inode = entry.inode()
+                        except OSError:
+                            continue
+                        games.append((default_title(entry.path), entry.path,
+                                      st.st_size, st.st_mtime_ns, inode))
+        except OSError:
+            return subdirs, None
+        return subdirs, entry_count
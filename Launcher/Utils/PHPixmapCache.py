@@ -0,0 +1,98 @@
+# Launcher/Utils/PHPixmapCache.py
+import configparser
+from collections import OrderedDict
+from dataclasses import dataclass
+from PySide6.QtGui import QPixmap
+
+from Launcher.Utils.Utils import get_user_config_path
+
+# Memory budget unless [ui] pixmap_cache_mb says otherwise
+DEFAULT_BUDGET_MB = 256
+
+
+@dataclass
+class PixmapCacheStats:
+    entries: int
+    bytes: int
+    budget_bytes: int
+    hits: int
+    misses: int
+    evictions: int
+
+    def __str__(self):
+        return (f"{self.entries} covers, {self.bytes / 2**20:.1f} of "
+                f"{self.budget_bytes / 2**20:.0f} MB; {self.hits} hits, {self.misses} misses, "
+                f"{self.evictions} evicted")
+
+
+def pixmap_bytes(pixmap: QPixmap) -> int:
+    return pixmap.width() * pixmap.height() * max(pixmap.depth(), 1) // 8
+
+
+class PixmapCache:
+    """
+    Decoded covers shared by every view, keyed by (game id, logical width,
+    logical height, device pixel ratio) and kept under a byte budget, least
+    recently used evicted first. Switching views or toggling titles finds the
+    covers already here. Each entry remembers the cover path it was made from,
+    so a game whose cover changes misses instead of showing the old image.
+    A null pixmap records a cover that could not be read. GUI thread only.
+    """
+
+    def __init__(self, budget_bytes: int = DEFAULT_BUDGET_MB * 2**20):
+        self.budget_bytes = budget_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[tuple, tuple[str, QPixmap, int]] = OrderedDict()
+        self._total_bytes = 0
+
+    def get(self, key: tuple, source: str) -> QPixmap | None:
+        """The pixmap cached under key if it was made from source, else None."""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != source:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def peek(self, key: tuple, source: str) -> QPixmap | None:
+        """Like get, for probing fallbacks: not counted and not marked as used."""
+        entry = self._entries.get(key)
+        return entry[1] if entry is not None and entry[0] == source else None
+
+    def put(self, key: tuple, source: str, pixmap: QPixmap):
+        self._drop(key)
+        size = pixmap_bytes(pixmap) if not pixmap.isNull() else 0
+        self._entries[key] = (source, pixmap, size)
+        self._total_bytes += size
+        while self._total_bytes > self.budget_bytes and len(self._entries) > 1:
+            self._drop(next(iter(self._entries)))
+            self.evictions += 1
+
+    def stats(self) -> PixmapCacheStats:
+        return PixmapCacheStats(len(self._entries), self._total_bytes, self.budget_bytes,
+                                self.hits, self.misses, self.evictions)
+
+    def _drop(self, key: tuple):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry[2]
+
+
+def load_budget_bytes() -> int:
+    config = configparser.ConfigParser()
+    config.read(str(get_user_config_path()))
+    return config.getint('ui', 'pixmap_cache_mb', fallback=DEFAULT_BUDGET_MB) * 2**20
+
+
+_cache: PixmapCache | None = None
+
+
+def pixmap_cache() -> PixmapCache:
+    """The process-wide PixmapCache, created on first use."""
+    global _cache
+    if _cache is None:
+        _cache = PixmapCache(load_budget_bytes())
+    return _cache
@@ -0,0 +1,74 @@
+# Launcher/Utils/PHScanWorker.py
+import threading
+import time
+from pathlib import Path
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+from Launcher.Utils.PHLibraryScanner import LibraryScanner, ScanStats, DEFAULT_CONCURRENCY
+from Launcher.Utils.PHGameMetadata import update_library_metadata
+from Launcher.Utils.PHCoverExtractor import extract_missing_covers
+from Launcher.Utils.PHFingerprint import update_fingerprints
+
+# Minimum seconds between two progress signals, so the GUI isn't flooded
+PROGRESS_INTERVAL = 0.1
+
+
+class ScanWorkerSignals(QObject):
+    """Signals for ScanWorker (a QRunnable cannot declare signals itself)."""
+    games_found = Signal(list)   # list[PHGameModel] newly added to the database
+    progress = Signal(object)    # ScanStats snapshot while the walk is running
+    finished = Signal(object)    # final ScanStats, with cancelled set if aborted at any stage
+
+
+class ScanWorker(QRunnable):
+    """
+    Runs a LibraryScanner on a QThreadPool thread, followed by the header metadata
+    stage for new or changed files, embedded cover extraction and fingerprinting,
+    and reports back via signals.
+    """
+
+    def __init__(self, scan_paths: list[Path], force_full: bool = False,
+                 concurrency: int = DEFAULT_CONCURRENCY):
+        super().__init__()
+        self.scanner = LibraryScanner(scan_paths, concurrency=concurrency)
+        self.force_full = force_full
+        self.signals = ScanWorkerSignals()
+        self._cancel_event = threading.Event()
+        self._last_progress = 0.0
+        self.done = False
+
+    def cancel(self):
+        """Ask the scan to stop after the directory it is currently listing."""
+        self._cancel_event.set()
+
+    def run(self):
+        stats = ScanStats()
+        try:
+            stats = self.scanner.scan(
+                force_full=self.force_full,
+                cancel_event=self._cancel_event,
+                on_batch=self.signals.games_found.emit,
+                on_progress=self._report_progress,
+            )
+            if not stats.cancelled:
+                stats.titles_updated = update_library_metadata(
+                    cancel_event=self._cancel_event, changed_ids=stats.changed_ids)
+                stats.covers_extracted = extract_missing_covers(
+                    cancel_event=self._cancel_event, changed_ids=stats.changed_ids)
+                stats.fingerprints_updated = update_fingerprints(cancel_event=self._cancel_event)
+        except Exception as e:
+            # e.g. an OSError, or "database is locked" after the busy timeout
+            stats.failed = True
+            stats.error = str(e) or type(e).__name__
+        finally:
+            # Cancelling during the metadata, cover or fingerprint stage counts too
+            stats.cancelled = self._cancel_event.is_set()
+            # Always report back, or the window would wait on this scan forever
+            self.done = True
+            self.signals.finished.emit(stats)
+
+    def _report_progress(self, stats):
+        now = time.monotonic()
+        if now - self._last_progress >= PROGRESS_INTERVAL:
+            self._last_progress = now
+            self.signals.progress.emit(stats)
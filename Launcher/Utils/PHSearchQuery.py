@@ -0,0 +1,134 @@
+# Launcher/Utils/PHSearchQuery.py
+"""
+The search bar's query language, compiled to one parameterized SQL statement.
+
+    halo "orange box"   title words (prefix match, any order) via the FTS index
+    played:>5           play count; also >=, <, <=, =, or a bare number
+    last:<30d           played within the last 30 days; >30d for longer ago
+                        (games never played match neither)
+                        (units: h, d, w, m = 30 days, y = 365 days)
+    ext:iso             file extension
+    missing:cover       no cover image; also missing:titleid
+    has:cover           the opposite of missing:
+    -ext:xex            a leading '-' negates a filter
+
+Unknown or malformed filters are searched as plain words. Results are ids,
+ranked by the text match when there is one and in title order otherwise.
+"""
+import re
+import shlex
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+
+_FILTER = re.compile(r"^(-?)(\w+):(.+)$")
+_COMPARISON = re.compile(r"^(>=|<=|>|<|=)?(\d+)$")
+_AGE = re.compile(r"^(>=|<=|>|<)?(\d+)([hdwmy])$")
+_AGE_UNITS = {"h": 1 / 24, "d": 1, "w": 7, "m": 30, "y": 365}
+# Expressions match the ones the games indexes were built on
+_PLAY_COUNT = "coalesce(games.play_count, 0)"
+_LAST_PLAYED = "coalesce(games.last_played, '')"
+_MISSING = {
+    "cover": "coalesce(games.cover_path, '') = ''",
+    "titleid": "coalesce(games.title_id, '') = ''",
+}
+
+
+@dataclass(frozen=True)
+class DaysAgo:
+    """A parameter bound to 'now minus days' each time the query runs."""
+    days: float
+
+    def resolve(self) -> str:
+        moment = datetime.now(timezone.utc) - timedelta(days=self.days)
+        return moment.strftime("%Y-%m-%d %H:%M:%S")
+
+
+@dataclass(frozen=True)
+class CompiledQuery:
+    sql: str
+    params: tuple
+
+    def bind(self) -> tuple:
+        """Parameters for one execution, with relative times resolved to now."""
+        return tuple(p.resolve() if isinstance(p, DaysAgo) else p for p in self.params)
+
+
+def fts_query(words: list[str]) -> str:
+    """
+    An FTS5 query in which every word must match the start of a word in the
+    game, so "halo 3" finds "Halo 3: ODST".
+    """
+    tokens = re.findall(r"\w+", " ".join(words).casefold())
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+@lru_cache(maxsize=256)
+def compile_query(text: str) -> CompiledQuery | None:
+    """
+    Parse a search string into SQL selecting matching game ids, or None if it
+    holds no terms. Cached per string, so retyping a query costs nothing.
+    """
+    try:
+        terms = shlex.split(text)
+    except ValueError:
+        terms = text.replace('"', " ").split()  # Unbalanced quote
+    words = []
+    clauses = []
+    params = []
+    for term in terms:
+        compiled = _compile_filter(term)
+        if compiled is None:
+            words.append(term)
+            continue
+        clause, clause_params = compiled
+        clauses.append(clause)
+        params.extend(clause_params)
+
+    match = fts_query(words)
+    if not match and not clauses:
+        return None
+    where = " AND ".join(clauses)
+    if match:
+        sql = ("SELECT games.id FROM games_fts JOIN games ON games.id = games_fts.rowid"
+               " WHERE games_fts MATCH ?")
+        if where:
+            sql += f" AND {where}"
+        return CompiledQuery(sql + " ORDER BY games_fts.rank", (match, *params))
+    # The unary + keeps SQLite from walking the sort_key index end to end; it
+    # seeks on the filter's index instead and sorts the (usually few) matches
+    return CompiledQuery(f"SELECT games.id FROM games WHERE {where} ORDER BY +games.sort_key, games.id",
+                         tuple(params))
+
+
+def _compile_filter(term: str) -> tuple[str, list] | None:
+    found = _FILTER.match(term)
+    if not found:
+        return None
+    negate, field, value = found.group(1), found.group(2).lower(), found.group(3).lower()
+    compiled = None
+    if field == "played":
+        comparison = _COMPARISON.match(value)
+        if comparison:
+            op = comparison.group(1) or "="
+            compiled = f"{_PLAY_COUNT} {op} ?", [int(comparison.group(2))]
+    elif field == "last":
+        age = _AGE.match(value)
+        if age:
+            days = int(age.group(2)) * _AGE_UNITS[age.group(3)]
+            # Less than N days ago means a later timestamp than the cutoff
+            op = {"<": ">", "<=": ">=", ">": "<", ">=": "<=", None: ">="}[age.group(1)]
+            clause = f"{_LAST_PLAYED} {op} ?"
+            if op in ("<", "<="):
+                # Never played sorts before any cutoff but isn't "longer ago"
+                clause = f"games.last_played IS NOT NULL AND {clause}"
+            compiled = clause, [DaysAgo(days)]
+    elif field == "ext":
+        compiled = "games.file_ext = ?", [value.lstrip(".")]
+    elif field in ("missing", "has") and value in _MISSING:
+        clause = _MISSING[value]
+        compiled = (clause if field == "missing" else f"NOT ({clause})"), []
+    if compiled is None:
+        return None
+    clause, clause_params = compiled
+    return (f"NOT ({clause})" if negate else clause), clause_params
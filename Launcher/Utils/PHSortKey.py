@@ -0,0 +1,42 @@
+# Launcher/Utils/PHSortKey.py
+import configparser
+import re
+
+from Launcher.Utils.Utils import get_user_config_path
+
+# Leading words ignored when ordering titles, unless [library] sort_ignore_articles says otherwise
+DEFAULT_SORT_ARTICLES = "the, a, an"
+# Width digit runs are padded to, so "Halo 3" sorts before "Halo 10"
+NUMBER_WIDTH = 10
+
+_DIGITS = re.compile(r"\d+")
+_articles: tuple[str, ...] | None = None
+
+
+def load_sort_articles() -> tuple[str, ...]:
+    """The articles to strip, from config.ini; an empty setting disables stripping."""
+    config = configparser.ConfigParser()
+    config.read(str(get_user_config_path()))
+    value = config.get('library', 'sort_ignore_articles', fallback=DEFAULT_SORT_ARTICLES)
+    return tuple(word.strip().casefold() for word in value.split(',') if word.strip())
+
+
+def sort_articles() -> tuple[str, ...]:
+    global _articles
+    if _articles is None:
+        _articles = load_sort_articles()
+    return _articles
+
+
+def sort_key(title: str) -> str:
+    """
+    The value stored in games.sort_key and used for title ordering, so the
+    database can sort through an index: case-folded, without a leading
+    article, and with numbers zero-padded so they compare by value.
+    """
+    key = title.casefold().strip()
+    for article in sort_articles():
+        if key.startswith(article + " "):
+            key = key[len(article) + 1:].lstrip()
+            break
+    return _DIGITS.sub(lambda m: m.group().zfill(NUMBER_WIDTH), key)
@@ -0,0 +1,172 @@
+# Launcher/Utils/PHThumbnailCache.py
+import configparser
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from PySide6.QtCore import QSize
+from PySide6.QtGui import QImage
+
+from Launcher.Utils.Utils import get_user_config_path
+
+THUMB_DIR = Path.home() / ".perch" / "thumbs"
+# Disk budget unless [ui] thumbnail_cache_mb says otherwise
+DEFAULT_BUDGET_MB = 256
+# Opaque covers are stored as JPEG, which decodes quickly; ones with alpha as PNG
+JPEG_QUALITY = 90
+
+
+@dataclass
+class ThumbnailCacheStats:
+    entries: int
+    bytes: int
+    budget_bytes: int
+    hits: int
+    misses: int
+    writes: int
+    evictions: int
+
+    def __str__(self):
+        return (f"{self.entries} thumbnails, {self.bytes / 2**20:.1f} of "
+                f"{self.budget_bytes / 2**20:.0f} MB; {self.hits} hits, {self.misses} misses, "
+                f"{self.writes} written, {self.evictions} evicted")
+
+
+class ThumbnailCache:
+    """
+    Pre-scaled covers on disk, so a cold start reads small files instead of
+    decoding every full-size original. A thumbnail is keyed by the source path,
+    size and mtime (an edited cover gets a new entry) and by the target size in
+    device pixels. Files are kept under a byte budget, evicting the least
+    recently used; file mtimes record use, so the order survives restarts.
+    Safe to use from several decoder threads.
+    """
+
+    def __init__(self, directory: Path = THUMB_DIR, budget_bytes: int = DEFAULT_BUDGET_MB * 2**20):
+        self.directory = directory
+        self.budget_bytes = budget_bytes
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[str, int]] | None = None  # key -> (file name, bytes)
+        self._total_bytes = 0
+
+    def load(self, path: str, size: QSize, dpr: float) -> QImage | None:
+        """The cached thumbnail of path for size, or None if there isn't one yet."""
+        key = self._key(path, size, dpr)
+        with self._lock:
+            self._ensure_index()
+            entry = self._entries.get(key) if key else None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+        file_path = self.directory / entry[0]
+        image = QImage(str(file_path))
+        if image.isNull():
+            # Deleted or damaged behind our back
+            with self._lock:
+                self._drop(key)
+                self.misses += 1
+            return None
+        try:
+            os.utime(file_path)
+        except OSError:
+            pass
+        with self._lock:
+            self.hits += 1
+        return image
+
+    def store(self, path: str, size: QSize, dpr: float, image: QImage):
+        key = self._key(path, size, dpr)
+        if not key or image.isNull():
+            return
+        file_format = "PNG" if image.hasAlphaChannel() else "JPG"
+        name = f"{key}.{file_format.lower()}"
+        file_path = self.directory / name
+        temp_path = self.directory / f"{name}.tmp"
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            if not image.save(str(temp_path), file_format, JPEG_QUALITY):
+                return
+            # Readers never see a half-written file
+            os.replace(temp_path, file_path)
+            file_bytes = file_path.stat().st_size
+        except OSError:
+            return
+        with self._lock:
+            self._ensure_index()
+            previous = self._entries.get(key)
+            # os.replace already overwrote a file of the same name
+            self._drop(key, delete=previous is not None and previous[0] != name)
+            self._entries[key] = (name, file_bytes)
+            self._total_bytes += file_bytes
+            self.writes += 1
+            while self._total_bytes > self.budget_bytes and len(self._entries) > 1:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def stats(self) -> ThumbnailCacheStats:
+        with self._lock:
+            self._ensure_index()
+            return ThumbnailCacheStats(len(self._entries), self._total_bytes, self.budget_bytes,
+                                       self.hits, self.misses, self.writes, self.evictions)
+
+    @staticmethod
+    def _key(path: str, size: QSize, dpr: float) -> str:
+        try:
+            source = os.stat(path)
+        except OSError:
+            return ""
+        raw = f"{path}\0{source.st_size}\0{source.st_mtime_ns}\0{size.width()}x{size.height()}@{dpr}"
+        return hashlib.sha1(raw.encode("utf-8", "surrogateescape")).hexdigest()
+
+    def _ensure_index(self):
+        # Called with the lock held; reads the directory once, oldest use first
+        if self._entries is not None:
+            return
+        found = []
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if entry.is_file() and not entry.name.endswith(".tmp"):
+                        stat = entry.stat()
+                        found.append((stat.st_mtime, entry.name, stat.st_size))
+        except OSError:
+            pass
+        found.sort()
+        self._entries = OrderedDict((name.split(".")[0], (name, size)) for _, name, size in found)
+        self._total_bytes = sum(size for _, _, size in found)
+
+    def _drop(self, key: str, delete: bool = True):
+        # Called with the lock held
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._total_bytes -= entry[1]
+        if delete:
+            try:
+                (self.directory / entry[0]).unlink()
+            except OSError:
+                pass
+
+
+def load_budget_bytes() -> int:
+    config = configparser.ConfigParser()
+    config.read(str(get_user_config_path()))
+    return config.getint('ui', 'thumbnail_cache_mb', fallback=DEFAULT_BUDGET_MB) * 2**20
+
+
+_cache: ThumbnailCache | None = None
+
+
+def thumbnail_cache() -> ThumbnailCache:
+    """The process-wide ThumbnailCache, created on first use."""
+    global _cache
+    if _cache is None:
+        _cache = ThumbnailCache(budget_bytes=load_budget_bytes())
+    return _cache
@@ -0,0 +1,73 @@
+# Launcher/Utils/PHWatchCoalescer.py
+import os
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from Launcher.Utils.PHLibraryScanner import GAME_EXTENSIONS
+
+# Default quiet period after the last change before a folder is rescanned
+DEFAULT_DEBOUNCE_MS = 1000
+
+
+class FolderChangeCoalescer(QObject):
+    """
+    Turns a storm of QFileSystemWatcher notifications into one rescan per folder.
+
+    Changed paths are reduced to the folder that needs re-listing and collected
+    until no new event has arrived for `debounce_ms`. Before a folder is released,
+    its game files must have the same size and mtime as at the previous check,
+    so an ISO that is still being copied is not indexed half-written.
+    """
+    directories_ready = Signal(list)  # list[str] of folders to rescan
+
+    def __init__(self, debounce_ms: int = DEFAULT_DEBOUNCE_MS, parent=None):
+        super().__init__(parent)
+        self._pending: dict[str, dict] = {}  # folder -> snapshot of its game files
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(debounce_ms)
+        self._timer.timeout.connect(self._on_quiet)
+
+    def add(self, path: str):
+        """Record a change notification for a file or folder."""
+        folder = path if os.path.isdir(path) else os.path.dirname(path)
+        # A deleted folder is rescanned through the nearest parent that still exists
+        while folder and not os.path.isdir(folder):
+            parent = os.path.dirname(folder)
+            if parent == folder:
+                return
+            folder = parent
+        if folder and folder not in self._pending:
+            self._pending[folder] = self._snapshot(folder)
+        self._timer.start()  # Restart the quiet period
+
+    def _on_quiet(self):
+        ready = []
+        for folder, previous in list(self._pending.items()):
+            current = self._snapshot(folder)
+            if current == previous:
+                ready.append(folder)
+                del self._pending[folder]
+            else:
+                # Something is still being written; check again after another window
+                self._pending[folder] = current
+        if self._pending:
+            self._timer.start()
+        if ready:
+            self.directories_ready.emit(ready)
+
+    @staticmethod
+    def _snapshot(folder: str) -> dict:
+        """Size and mtime of each game file directly inside folder."""
+        snapshot = {}
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    if entry.name.lower().endswith(GAME_EXTENSIONS):
+                        try:
+                            st = entry.stat()
+                        except OSError:
+                            continue
+                        snapshot[entry.name] = (st.st_size, st.st_mtime_ns)
+        except OSError:
+            pass
+        return snapshot
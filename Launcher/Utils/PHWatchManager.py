@@ -0,0 +1,169 @@
+# Launcher/Utils/PHWatchManager.py
+import os
+from PySide6.QtCore import QObject, QFileSystemWatcher, QThreadPool, QTimer, Signal
+
+from Launcher.DB import PHDatabase
+from Launcher.Utils.PHLibraryScanner import UNLISTED_MTIME
+
+# Where Linux publishes the per-user inotify watch limit
+INOTIFY_LIMIT_PATH = "/proc/sys/fs/inotify/max_user_watches"
+# Share of the inotify limit we allow ourselves; other programs need watches too
+INOTIFY_SHARE = 0.25
+# Watch budget on platforms without a readable limit
+FALLBACK_MAX_WATCHES = 4096
+DEFAULT_POLL_SECONDS = 30
+
+
+def read_inotify_limit() -> int | None:
+    try:
+        with open(INOTIFY_LIMIT_PATH) as f:
+            return int(f.read().strip())
+    except (OSError, ValueError):
+        return None
+
+
+class WatchManager(QObject):
+    """
+    Watches every folder under the scan roots (never individual files) and
+    reports the folder that changed.
+
+    The set of folders comes from the scan manifest, so no extra walk is needed,
+    and is kept up to date as subfolders appear or disappear. If the library needs
+    more watches than the budget allows (or the OS refuses one), all watches are
+    dropped and the manifest folders are polled for mtime changes instead.
+    """
+    directory_changed = Signal(str)
+    _poll_result = Signal(list)  # Changed folders found by a poll on the thread pool
+
+    def __init__(self, max_watches: int = 0, poll_seconds: int = DEFAULT_POLL_SECONDS, parent=None):
+        super().__init__(parent)
+        self.watch_limit = read_inotify_limit()
+        if max_watches > 0:
+            self.max_watches = max_watches
+        elif self.watch_limit:
+            self.max_watches = int(self.watch_limit * INOTIFY_SHARE)
+        else:
+            self.max_watches = FALLBACK_MAX_WATCHES
+        self.polling = False
+        self._roots: list[str] = []
+        self._watched: set[str] = set()
+        self._known_mtimes: dict[str, int] = {}
+        self._poll_running = False
+
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._on_directory_changed)
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setInterval(poll_seconds * 1000)
+        self._poll_timer.timeout.connect(self._poll)
+        self._poll_result.connect(self._on_poll_result)
+
+    @property
+    def watch_count(self) -> int:
+        return len(self._watched)
+
+    def set_roots(self, roots: list[str]):
+        """Replace the watched roots and start watching their known subfolders."""
+        self._roots = [os.path.normpath(r) for r in roots if os.path.isdir(r)]
+        self._unwatch(set(self._watched))
+        self.polling = False
+        self._poll_timer.stop()
+        self.sync_from_manifest()
+
+    def sync_from_manifest(self):
+        """Bring watches in line with the folders the last scan recorded."""
+        self._known_mtimes = self._load_manifest()
+        wanted = set(self._roots) | set(self._known_mtimes)
+        if len(wanted) > self.max_watches:
+            self._start_polling()
+            return
+        if self.polling:
+            self.polling = False
+            self._poll_timer.stop()
+        self._unwatch(self._watched - wanted)
+        self._watch(wanted - self._watched)
+
+    def _load_manifest(self) -> dict[str, int]:
+        if not self._roots:
+            return {}
+        prefixes = tuple(root.rstrip(os.sep) + os.sep for root in self._roots)
+        rows = PHDatabase.fetch_all("SELECT dir_path, mtime FROM scan_manifest")
+        return {d: mtime for d, mtime in rows if d in self._roots or d.startswith(prefixes)}
+
+    def _watch(self, dirs: set[str]):
+        if not dirs or self.polling:
+            return
+        if len(self._watched) + len(dirs) > self.max_watches:
+            self._start_polling()
+            return
+        failed = set(self._watcher.addPaths(sorted(dirs)))
+        self._watched.update(dirs - failed)
+        if failed:
+            # Most likely out of inotify watches; polling still notices every change
+            self._start_polling()
+
+    def _unwatch(self, dirs: set[str]):
+        if dirs:
+            self._watcher.removePaths(sorted(dirs))
+            self._watched.difference_update(dirs)
+
+    def _on_directory_changed(self, path: str):
+        path = os.path.normpath(path)
+        # Drop watches for folders that are gone, add them for new subfolders
+        gone = {d for d in self._watched
+                if (d == path or d.startswith(path + os.sep)) and not os.path.isdir(d)}
+        self._unwatch(gone)
+        if os.path.isdir(path):
+            self._watch(self._new_subtrees(path))
+        self.directory_changed.emit(path)
+
+    def _new_subtrees(self, path: str) -> set[str]:
+        """Folders below path that aren't watched yet, including everything inside them."""
+        found = set()
+        pending = [path]
+        while pending:
+            current = pending.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False) and entry.path not in self._watched:
+                            found.add(entry.path)
+                            pending.append(entry.path)
+            except OSError:
+                continue
+        return found
+
+    # ─── Polling fallback ────────────────────────────────────────────────
+
+    def _start_polling(self):
+        if self.polling:
+            return
+        self.polling = True
+        # Give every inotify handle back; the poll covers all manifest folders
+        self._unwatch(set(self._watched))
+        self._poll_timer.start()
+
+    def _poll(self):
+        if self._poll_running:
+            return
+        self._poll_running = True
+        known = dict(self._known_mtimes)
+        QThreadPool.globalInstance().start(lambda: self._poll_result.emit(self._changed_dirs(known)))
+
+    @staticmethod
+    def _changed_dirs(known: dict[str, int]) -> list[str]:
+        """One stat per folder: report those whose mtime differs from the manifest."""
+        changed = []
+        for dir_path, mtime in known.items():
+            if mtime == UNLISTED_MTIME:
+                continue  # Never matches; the next scan lists it again anyway
+            try:
+                if os.stat(dir_path).st_mtime_ns != mtime:
+                    changed.append(dir_path)
+            except OSError:
+                changed.append(dir_path)
+        return changed
+
+    def _on_poll_result(self, changed: list):
+        self._poll_running = False
+        for dir_path in changed:
+            self.directory_changed.emit(dir_path)
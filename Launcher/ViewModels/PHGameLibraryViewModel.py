@@ -1,9 +1,21 @@
+import os
 import sqlite3
 import configparser
 from pathlib import Path
-from Launcher.DB.PHDatabase import DB_PATH
+from Launcher.DB import PHDatabase
 from Launcher.Utils.Utils import get_user_config_path
 from Launcher.Models.PHGameModel import PHGameModel
+from Launcher.Utils.PHGameMetadata import default_title, file_extension
+from Launcher.Utils.PHSortKey import sort_key
+from Launcher.Utils.PHLibraryScanner import LibraryScanner, ScanStats, DEFAULT_CONCURRENCY
+
+# Sort orders for get_games_page, each matching an index that ends in id
+SORT_EXPRESSIONS = {
+    'title': "sort_key",
+    'last_played': "coalesce(last_played, '')",
+    'play_count': "coalesce(play_count, 0)",
+}
+DEFAULT_PAGE_SIZE = 200
 
 class GameLibraryViewModel:
     def __init__(self):
@@ -12,82 +24,88 @@ class GameLibraryViewModel:
         config.read(str(get_user_config_path()))
         folders = config.get('library', 'scan_folders', fallback='').split(';')
         self.scan_paths = [Path(p) for p in folders if p]
+        # Cap on how many scan folders (devices) are walked at once; 1 scans them in turn
+        self.scan_concurrency = config.getint('library', 'scan_concurrency', fallback=DEFAULT_CONCURRENCY)
+        self.last_scan_stats: ScanStats | None = None
 
-    def scan_library(self):
-        # Scan folders and insert any new game files into the database
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        for folder in self.scan_paths:
-            if not folder.exists():
-                continue
-            for ext in ('*.iso', '*.xex', '*.elf', '*.stfs'):
-                for file in folder.rglob(ext):
-                    title = file.stem
-                    try:
-                        cursor.execute(
-                            "INSERT INTO games (title, file_path) VALUES (?, ?)",
-                            (title, str(file))
-                        )
-                    except sqlite3.IntegrityError:
-                        pass  # Already in DB
-        conn.commit()
-        conn.close()
+    def scan_library(self, force_full: bool = False) -> ScanStats:
+        """
+        Scan folders and insert any new game files into the database.
+        Pass force_full=True to ignore the directory manifest and re-list everything.
+        """
+        scanner = LibraryScanner(self.scan_paths, concurrency=self.scan_concurrency)
+        self.last_scan_stats = scanner.scan(force_full=force_full)
+        return self.last_scan_stats
 
-    def add_game(self, file_path: str):
-        # Manually add a single game file
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        title = Path(file_path).stem
+    def add_game(self, file_path: str) -> int | None:
+        # Manually add a single game file; returns its id, or None if it was already known
+        title = default_title(file_path)
         try:
-            cursor.execute(
-                "INSERT INTO games (title, file_path) VALUES (?, ?)",
-                (title, file_path)
+            st = os.stat(file_path)
+            file_stats = (st.st_size, st.st_mtime_ns, st.st_ino)
+        except OSError:
+            file_stats = (None, None, None)
+        try:
+            cursor = PHDatabase.execute(
+                "INSERT INTO games (title, sort_key, file_path, file_ext, file_size, file_mtime, file_inode)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (title, sort_key(title), file_path, file_extension(file_path), *file_stats)
             )
-            conn.commit()
         except sqlite3.IntegrityError:
-            pass  # Already in DB
-        conn.close()
-
-    def get_all_games(self) -> list[PHGameModel]:
-        # Retrieve all games from the database
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT id, title, file_path, cover_path, last_played, play_count"
-            " FROM games ORDER BY title ASC"
-        )
-        rows = cursor.fetchall()
-        conn.close()
-        return [PHGameModel(*row) for row in rows]
+            return None  # Already in DB
+        return cursor.lastrowid
 
-    def delete_game(self, game_id: int):
+    def get_games_page(self, sort: str = 'title', descending: bool = False,
+                       after: tuple | None = None,
+                       page_size: int = DEFAULT_PAGE_SIZE) -> tuple[list[PHGameModel], tuple | None]:
         """
-        Remove a game from the database by its ID.
+        Return one page of games in the given order, read straight off the index.
+        Pass the cursor returned with a page as `after` to get the next one; the
+        cursor is None once the last page has been returned.
+
+        Not used by the views, which show the whole library from LibraryStore;
+        this is for callers that want a few rows without loading everything.
         """
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM games WHERE id = ?", (game_id,))
-        conn.commit()
-        conn.close()
+        expression = SORT_EXPRESSIONS[sort]
+        direction = "DESC" if descending else "ASC"
+        where = ""
+        params = []
+        if after is not None:
+            # The bare range on the sort value is what lets SQLite seek into the index
+            op = '<' if descending else '>'
+            where = f"WHERE {expression} {op}= ? AND ({expression}, id) {op} (?, ?)"
+            params.extend((after[0], *after))
+        rows = PHDatabase.fetch_all(
+            f"SELECT id, title, file_path, cover_path, last_played, play_count, {expression}"
+            f" FROM games {where}"
+            f" ORDER BY {expression} {direction}, id {direction} LIMIT ?",
+            (*params, page_size)
+        )
+        games = [PHGameModel(*row[:6]) for row in rows]
+        cursor = (rows[-1][6], rows[-1][0]) if len(rows) == page_size else None
+        return games, cursor
 
-    def update_cover(self, game_id: int, cover_path: str):
+    def search_game_ids(self, text: str) -> list[int]:
+        """Ids of the games matching a search query (see PHSearchQuery), best match first."""
+        return PHDatabase.search_game_ids(text)
+
+    def get_duplicate_groups(self) -> list[list[PHGameModel]]:
         """
-        Update the cover_path for a game in the database.
+        Return groups of games whose files share a content fingerprint, most
+        played (then most recently played) first within each group.
         """
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        cursor.execute(
-            "UPDATE games SET cover_path = ? WHERE id = ?",
-            (cover_path, game_id)
+        rows = PHDatabase.fetch_all(
+            """
+            SELECT fingerprint, id, title, file_path, cover_path, last_played, play_count
+              FROM games
+             WHERE fingerprint IN (
+                       SELECT fingerprint FROM games
+                        WHERE fingerprint IS NOT NULL
+                        GROUP BY fingerprint HAVING COUNT(*) > 1)
+             ORDER BY fingerprint, play_count DESC, last_played DESC, id
+            """
         )
-        conn.commit()
-        conn.close()
-
-    def get_file_path(self, game_id: int) -> str:
-        """Retrieve the file_path for a game by its ID."""
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        cursor.execute("SELECT file_path FROM games WHERE id = ?", (game_id,))
-        row = cursor.fetchone()
-        conn.close()
-        return row[0] if row and row[0] else ""
\ No newline at end of file
+        groups = {}
+        for fingerprint, *game in rows:
+            groups.setdefault(fingerprint, []).append(PHGameModel(*game))
+        return list(groups.values())
@@ -1,9 +1,15 @@
 import configparser
 from pathlib import Path
 from typing import List
+from PySide6.QtCore import QThreadPool
 
 from Launcher.ViewModels.PHGameLibraryViewModel import GameLibraryViewModel
 from Launcher.Models.PHGameModel import PHGameModel
+from Launcher.Models.PHLibraryStore import library_store
+from Launcher.Utils.PHLibraryScanner import ScanStats
+from Launcher.Utils.PHScanWorker import ScanWorker
+from Launcher.Utils.PHWatchCoalescer import DEFAULT_DEBOUNCE_MS
+from Launcher.Utils.PHWatchManager import DEFAULT_POLL_SECONDS
 from Launcher.Utils.Utils import get_user_config_path
 
 class MainWindowViewModel:
@@ -28,12 +34,24 @@ class MainWindowViewModel:
             self.list_mode = self.config.getboolean('ui', 'list_mode', fallback=False)
         else:
             self.list_mode = False
+        self.one_entry_per_game = self.config.getboolean('ui', 'one_entry_per_game', fallback=False)
+        # Quiet period used to coalesce bursts of file-system notifications
+        self.watch_debounce_ms = self.config.getint('library', 'watch_debounce_ms', fallback=DEFAULT_DEBOUNCE_MS)
+        # Folder watch budget (0 = a share of the OS limit) and the poll period used above it
+        self.max_watches = self.config.getint('library', 'max_watches', fallback=0)
+        self.watch_poll_seconds = self.config.getint('library', 'watch_poll_seconds', fallback=DEFAULT_POLL_SECONDS)
         self.current_filter = ''
+        # Tag filter: show games with all (or, if not tag_match_all, any) of these tags
+        self.active_tag_ids: set[int] = set()
+        self.tag_match_all = True
 
-        # Underlying game library VM for data access
+        # Underlying game library VM for data access; scanning happens in the
+        # background (see start_scan), so start from what the database already has
         self.game_library_vm = GameLibraryViewModel()
-        self.game_library_vm.scan_library()
-        self._all_games = self.game_library_vm.get_all_games()
+        # Shared in-memory library; views listen to its change signals
+        self.store = library_store()
+        self._hidden_duplicates = self._load_hidden_duplicates()
+        self._scan_worker: ScanWorker | None = None
 
     def _load_cover_width(self) -> int:
         ini_path = self.config_path
@@ -68,14 +86,108 @@ class MainWindowViewModel:
         with open(self.config_path, 'w') as cfgfile:
             self.config.write(cfgfile)
 
+    def set_one_entry_per_game(self, enabled: bool):
+        self.one_entry_per_game = enabled
+        if not self.config.has_section('ui'):
+            self.config.add_section('ui')
+        self.config.set('ui', 'one_entry_per_game', str(enabled))
+        with open(self.config_path, 'w') as cfgfile:
+            self.config.write(cfgfile)
+        self._hidden_duplicates = self._load_hidden_duplicates()
+
+    def _load_hidden_duplicates(self) -> set[int]:
+        # Every copy but the first (most played) of each duplicate group
+        if not self.one_entry_per_game:
+            return set()
+        return {g.id for group in self.game_library_vm.get_duplicate_groups() for g in group[1:]}
+
     def set_filter(self, filter_text: str):
         self.current_filter = filter_text.lower().strip()
 
-    def refresh_games(self):
-        self.game_library_vm.scan_library()
-        self._all_games = self.game_library_vm.get_all_games()
+    def set_tag_filter(self, tag_ids, match_all: bool = True):
+        self.active_tag_ids = set(tag_ids)
+        self.tag_match_all = match_all
+
+    def has_active_filter(self) -> bool:
+        return bool(self.current_filter or self.active_tag_ids or self._hidden_duplicates)
+
+    def refresh_games(self) -> tuple[List[PHGameModel], List[int], List[PHGameModel]]:
+        """
+        Re-read the whole library into the store, after a full rescan; the store
+        signals the rows that changed.
+        Returns (added games, removed ids, changed games) relative to the previous list.
+        """
+        self._hidden_duplicates = self._load_hidden_duplicates()
+        return self.store.reload()
+
+    def apply_scan_changes(self, stats: ScanStats, full: bool = False):
+        """
+        Bring the store up to date after a scan. New games were streamed in as they
+        were found; only the rows the scan then edited or deleted are re-read.
+        """
+        if full:
+            self.refresh_games()
+            return
+        if stats.fingerprints_updated or stats.removed_ids:
+            # Copies may have been matched up or lost their partner
+            self._hidden_duplicates = self._load_hidden_duplicates()
+        self.store.apply_changes(stats.changed_ids, stats.removed_ids)
+
+    def add_games(self, paths: List[str]) -> List[PHGameModel]:
+        """Add game files by hand; returns the ones that were new to the library."""
+        game_ids = [self.game_library_vm.add_game(p) for p in paths]
+        added, _, _ = self.store.apply_changes([i for i in game_ids if i is not None], ())
+        return added
+
+    def create_scan_worker(self, force_full: bool = False,
+                           only_dirs: List[str] | None = None) -> ScanWorker:
+        """
+        Build a worker for the configured scan folders, or only for the given
+        folders (and whatever changed beneath them) when only_dirs is set.
+        """
+        paths = [Path(d) for d in only_dirs] if only_dirs else self.game_library_vm.scan_paths
+        return ScanWorker(
+            paths,
+            force_full=force_full,
+            concurrency=self.game_library_vm.scan_concurrency,
+        )
+
+    def is_scanning(self) -> bool:
+        return self._scan_worker is not None and not self._scan_worker.done
+
+    def is_current_scan(self, worker: ScanWorker) -> bool:
+        """False for a worker that has since been cancelled or replaced."""
+        return worker is self._scan_worker
+
+    def start_scan(self, worker: ScanWorker):
+        """Cancel any scan in progress and run the given worker on the thread pool."""
+        self.cancel_scan()
+        self._scan_worker = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def cancel_scan(self):
+        if self._scan_worker is not None:
+            self._scan_worker.cancel()
+            self._scan_worker = None
+
+    def add_scanned_games(self, games: List[PHGameModel]) -> List[PHGameModel]:
+        """Merge games streamed from a scan; returns the ones that were new."""
+        return self.store.add_games(games)
 
     def get_filtered_games(self) -> List[PHGameModel]:
+        games = self.store.games()
+        if self._hidden_duplicates:
+            games = [g for g in games if g.id not in self._hidden_duplicates]
+        if self.active_tag_ids:
+            # Known tags only, so a tag deleted while filtering no longer applies
+            known = {tag_id for tag_id, _ in self.store.tags()}
+            tag_ids = self.active_tag_ids & known
+            if tag_ids:
+                tagged = self.store.tagged_game_ids(tag_ids, self.tag_match_all)
+                games = [g for g in games if g.id in tagged]
         if not self.current_filter:
-            return self._all_games
-        return [g for g in self._all_games if self.current_filter in g.title.lower()]
\ No newline at end of file
+            return games
+        # Matches come back from the full-text index in rank order
+        by_id = {g.id: g for g in games}
+        return [by_id[game_id] for game_id in self.game_library_vm.search_game_ids(self.current_filter)
+                if game_id in by_id]
\ No newline at end of file
@@ -0,0 +1,430 @@
+# Launcher/Views/PHGameGridView.py
+from PySide6.QtWidgets import (
+    QListView, QStyledItemDelegate, QStyle, QAbstractItemView,
+    QMenu, QFileDialog, QMessageBox
+)
+from PySide6.QtGui import QPixmap, QPainter, QPen, QColor, QPalette, QFontMetrics, QGuiApplication
+from PySide6.QtCore import (
+    Qt, QSize, QRect, QAbstractListModel, QModelIndex, QPersistentModelIndex, QTimer, Signal
+)
+
+from Launcher.Controllers.PHGameWidgetController import GameWidgetController
+from Launcher.Utils.PHCoverLoader import cover_loader
+from Launcher.Utils.PHImages import get_placeholder_pixmap
+from Launcher.Utils.PHPixmapCache import pixmap_cache
+from Launcher.Views.PHTagMenu import add_tags_menu, ask_tag_name
+
+# Item data role holding a row's PHGameModel
+GAME_ROLE = Qt.UserRole
+# Space around each cover, and between the cover and its title
+CELL_MARGIN = 5
+TITLE_SPACING = 4
+# Space between cells
+GRID_SPACING = 10
+SELECTION_COLOR = "#FFD700"
+# Resizes are re-flowed at most once per frame (~60 Hz)
+RELAYOUT_INTERVAL_MS = 16
+# Cover decodes for cells scrolled out of view are cancelled once scrolling pauses
+CANCEL_OFFSCREEN_MS = 100
+# Cover widths (logical pixels) pre-scaled for zooming with the size slider (100-600);
+# the largest covers stretch the 512 level rather than decode a 1024 one at ~6 MB each
+PYRAMID_LEVELS = (128, 256, 512)
+# Covers are 2:3 like the box art
+COVER_ASPECT = 1.5
+
+
+class GameGridModel(QAbstractListModel):
+    """The games shown in the grid, one row per game, in display order."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._games = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._games)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        game = self._games[index.row()]
+        if role in (Qt.DisplayRole, Qt.ToolTipRole):
+            return game.title
+        if role == GAME_ROLE:
+            return game
+        return None
+
+    def set_games(self, games):
+        """
+        Show games, in order. Rows that stay keep their place, so the selection and
+        scroll position survive; only rows that come or go are removed or inserted.
+        """
+        new_ids = [g.id for g in games]
+        wanted = set(new_ids)
+
+        # Drop rows no longer shown, one contiguous run at a time from the bottom
+        row = len(self._games) - 1
+        while row >= 0:
+            if self._games[row].id in wanted:
+                row -= 1
+                continue
+            end = row
+            while row >= 0 and self._games[row].id not in wanted:
+                row -= 1
+            self.beginRemoveRows(QModelIndex(), row + 1, end)
+            del self._games[row + 1:end + 1]
+            self.endRemoveRows()
+
+        kept = {g.id for g in self._games}
+        if [game_id for game_id in new_ids if game_id in kept] != [g.id for g in self._games]:
+            # Reordered (e.g. search ranking changed); rebuild the rows
+            self.beginResetModel()
+            self._games = list(games)
+            self.endResetModel()
+            return
+
+        # Insert new games in runs between the rows that stayed
+        row = 0
+        while row < len(games):
+            if games[row].id in kept:
+                self._games[row] = games[row]  # The store may hand out fresh objects
+                row += 1
+                continue
+            end = row
+            while end < len(games) and games[end].id not in kept:
+                end += 1
+            self.beginInsertRows(QModelIndex(), row, end - 1)
+            self._games[row:row] = games[row:end]
+            self.endInsertRows()
+            row = end
+        if self._games:
+            self.dataChanged.emit(self.index(0), self.index(len(self._games) - 1))
+
+    def update_games(self, games) -> bool:
+        """
+        Repaint the rows of games changed in place (cover, title, play stats).
+        Returns True if a retitled game now belongs elsewhere in title order.
+        """
+        rows = {g.id: row for row, g in enumerate(self._games)}
+        moved = False
+        for game in games:
+            row = rows.get(game.id)
+            if row is not None:
+                moved = moved or self._games[row].sort_key != game.sort_key
+                self._games[row] = game
+                index = self.index(row)
+                self.dataChanged.emit(index, index)
+        return moved
+
+
+class GameCoverDelegate(QStyledItemDelegate):
+    """
+    Paints one grid cell: the cover scaled to fit, the title below it when titles
+    are shown, and a gold border when selected. Only cells in view are painted.
+    Covers come from the shared pixmap cache; ones not decoded yet are requested
+    from the cover loader and, until cover_ready asks for a repaint, drawn from
+    the nearest size already cached (or as the placeholder).
+
+    While zooming (the size slider is moving) covers are drawn from a pyramid of
+    pre-scaled levels (PYRAMID_LEVELS), stretched with a fast unfiltered scale,
+    so a drag costs at most one decode per game per level. Exact covers are
+    decoded once the size settles.
+    """
+    cover_ready = Signal()
+
+    def __init__(self, cover_width: int, cover_height: int, show_titles: bool, parent=None):
+        super().__init__(parent)
+        self.cover_width = cover_width
+        self.cover_height = cover_height
+        self.show_titles = show_titles
+        self.zooming = False
+        self._settled_width = cover_width  # Last size covers were decoded exactly at
+        self._pixmaps = pixmap_cache()
+        self._placeholder = None
+        # Requests in flight: cover key -> (index of the cell that asked, cover path)
+        self.pending: dict[tuple, tuple[QPersistentModelIndex, str]] = {}
+        self._loader = cover_loader()
+        self._loader.cover_loaded.connect(self._on_cover_loaded)
+
+    def set_cover_size(self, cover_width: int, cover_height: int, zooming: bool = False):
+        self.cover_width = cover_width
+        self.cover_height = cover_height
+        self.zooming = zooming
+        if not zooming:
+            self._settled_width = cover_width
+            self._placeholder = None  # While zooming the old one is stretched
+        # Keep pyramid requests; exact ones for a size no longer shown are stale
+        for key in list(self.pending):
+            if key[1] not in PYRAMID_LEVELS and key[1] != self._settled_width:
+                self.cancel(key)
+
+    def cancel(self, key):
+        self.pending.pop(key, None)
+        self._loader.cancel(key)
+
+    def cell_size(self, font_metrics: QFontMetrics) -> QSize:
+        height = self.cover_height + 2 * CELL_MARGIN
+        if self.show_titles:
+            height += TITLE_SPACING + font_metrics.height()
+        return QSize(self.cover_width + 2 * CELL_MARGIN, height)
+
+    def sizeHint(self, option, index):
+        return self.cell_size(QFontMetrics(option.font))
+
+    def paint(self, painter, option, index):
+        game = index.data(GAME_ROLE)
+        if game is None:
+            return
+        rect = option.rect
+        painter.save()
+
+        # Cover, fitted and centred in its box like the old fixed-size label. An
+        # exact cover is drawn 1:1; a stand-in from another size is stretched
+        # without smoothing, which is cheap on the raster engine
+        pixmap = self._cover(game, index)
+        dpr = pixmap.devicePixelRatio()
+        size = QSize(round(pixmap.width() / dpr), round(pixmap.height() / dpr))
+        size = size.scaled(QSize(self.cover_width, self.cover_height), Qt.KeepAspectRatio)
+        x = rect.x() + CELL_MARGIN + (self.cover_width - size.width()) // 2
+        y = rect.y() + CELL_MARGIN + (self.cover_height - size.height()) // 2
+        painter.drawPixmap(QRect(x, y, size.width(), size.height()), pixmap)
+
+        if self.show_titles:
+            metrics = QFontMetrics(option.font)
+            title_rect = QRect(
+                rect.x() + CELL_MARGIN, rect.y() + CELL_MARGIN + self.cover_height + TITLE_SPACING,
+                self.cover_width, metrics.height()
+            )
+            painter.setFont(option.font)
+            painter.setPen(option.palette.color(QPalette.WindowText))
+            painter.drawText(title_rect, Qt.AlignCenter,
+                             metrics.elidedText(game.title, Qt.ElideRight, title_rect.width()))
+
+        if option.state & QStyle.State_Selected:
+            painter.setPen(QPen(QColor(SELECTION_COLOR), 2))
+            painter.setBrush(Qt.NoBrush)
+            painter.drawRect(rect.adjusted(1, 1, -1, -1))
+        painter.restore()
+
+    def _cover(self, game, index) -> QPixmap:
+        path = game.cover_path
+        if not path:
+            return self._placeholder_pixmap()
+        # Decoded at device pixel ratio for crisp rendering
+        dpr = QGuiApplication.primaryScreen().devicePixelRatio()
+        if self.zooming:
+            width = self._pyramid_level(self.cover_width)
+            key = (game.id, width, int(width * COVER_ASPECT), dpr)
+        else:
+            key = (game.id, self.cover_width, self.cover_height, dpr)
+        pixmap = self._pixmaps.get(key, path)
+        if pixmap is not None:
+            # A null pixmap marks a missing or unreadable file
+            return pixmap if not pixmap.isNull() else self._placeholder_pixmap()
+        if key not in self.pending:
+            self._loader.request(key, path, QSize(int(key[1] * dpr), int(key[2] * dpr)), dpr)
+        self.pending[key] = (QPersistentModelIndex(index), path)
+        return self._nearest_cached(game, dpr) or self._placeholder_pixmap()
+
+    @staticmethod
+    def _pyramid_level(width: int) -> int:
+        """The level nearest width; stretching it up a little is cheaper than decoding more."""
+        return min(PYRAMID_LEVELS, key=lambda level: abs(level - width))
+
+    def _nearest_cached(self, game, dpr) -> QPixmap | None:
+        # Any pyramid level or the last exact size, preferring the closest larger one
+        widths = sorted({*PYRAMID_LEVELS, self._settled_width},
+                        key=lambda w: (w < self.cover_width, abs(w - self.cover_width)))
+        for width in widths:
+            pixmap = self._pixmaps.peek((game.id, width, int(width * COVER_ASPECT), dpr), game.cover_path)
+            if pixmap is not None and not pixmap.isNull():
+                return pixmap
+        return None
+
+    def _on_cover_loaded(self, key, image):
+        request = self.pending.pop(key, None)
+        if request is None:
+            return  # Another view's request, or one cancelled since
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(key[3])
+        self._pixmaps.put(key, request[1], pixmap)
+        self.cover_ready.emit()
+
+    def _placeholder_pixmap(self) -> QPixmap:
+        if self._placeholder is None:
+            dpr = QGuiApplication.primaryScreen().devicePixelRatio()
+            self._placeholder = get_placeholder_pixmap(self.cover_width, self.cover_height).scaled(
+                int(self.cover_width * dpr), int(self.cover_height * dpr),
+                Qt.KeepAspectRatio, Qt.SmoothTransformation
+            )
+            self._placeholder.setDevicePixelRatio(dpr)
+        return self._placeholder
+
+
+class GameGridView(QListView):
+    """
+    The cover grid. Games are rows of a GameGridModel laid out in icon mode and
+    painted by GameCoverDelegate, so there is no widget per game: the view only
+    lays out cell rectangles and paints the ones in the viewport.
+    """
+
+    def __init__(self, cover_width: int = 300, cover_height: int = 450,
+                 show_titles: bool = True, parent=None):
+        super().__init__(parent)
+        self.empty_text = ""
+
+        self.setViewMode(QListView.IconMode)
+        self.setMovement(QListView.Static)
+        # Resizes are handled in resizeEvent, which only re-flows when the column count changes
+        self.setResizeMode(QListView.Fixed)
+        self._columns = 0
+        self._relayout_timer = QTimer(self)
+        self._relayout_timer.setSingleShot(True)
+        self._relayout_timer.setInterval(RELAYOUT_INTERVAL_MS)
+        self._relayout_timer.timeout.connect(self._relayout)
+        self.setWrapping(True)
+        self.setUniformItemSizes(True)
+        self.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+
+        self.grid_model = GameGridModel(self)
+        self.setModel(self.grid_model)
+        self.delegate = GameCoverDelegate(cover_width, cover_height, show_titles, self)
+        self.setItemDelegate(self.delegate)
+        self._update_grid_size()
+        # Repaint whatever is in view as decoded covers arrive (updates are coalesced)
+        self.delegate.cover_ready.connect(self.viewport().update)
+        self._cancel_timer = QTimer(self)
+        self._cancel_timer.setSingleShot(True)
+        self._cancel_timer.setInterval(CANCEL_OFFSCREEN_MS)
+        self._cancel_timer.timeout.connect(self._cancel_offscreen)
+        self.verticalScrollBar().valueChanged.connect(self._cancel_timer.start)
+
+        self.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.customContextMenuRequested.connect(self.on_context_menu)
+        self.doubleClicked.connect(self.on_double_clicked)
+
+    def set_games(self, games):
+        self.grid_model.set_games(games)
+        self.viewport().update()
+        self._cancel_timer.start()
+
+    def update_games(self, games) -> bool:
+        return self.grid_model.update_games(games)
+
+    def set_empty_text(self, text: str):
+        self.empty_text = text
+        self.viewport().update()
+
+    def set_cover_size(self, cover_width: int, cover_height: int):
+        """Show covers at a new size, decoded exactly at that size."""
+        self.delegate.set_cover_size(cover_width, cover_height)
+        self._update_grid_size()
+        self.viewport().update()
+
+    def zoom_to(self, cover_width: int, cover_height: int):
+        """Resize covers while the size slider moves, drawing them from the pyramid."""
+        self.delegate.set_cover_size(cover_width, cover_height, zooming=True)
+        self._update_grid_size()
+
+    def set_show_titles(self, show: bool):
+        self.delegate.show_titles = show
+        self._update_grid_size()
+
+    def _update_grid_size(self):
+        # Every cell is the same size; setting the grid re-flows the layout
+        cell = self.delegate.cell_size(self.fontMetrics())
+        self.setGridSize(QSize(cell.width() + GRID_SPACING, cell.height() + GRID_SPACING))
+        self._columns = self._column_count()
+
+    def _column_count(self) -> int:
+        return max(1, self.viewport().width() // max(1, self.gridSize().width()))
+
+    def resizeEvent(self, event):
+        # Also called when the viewport changes size (e.g. the scroll bar appears).
+        # Cells only move when a column is gained or lost, and a window drag's
+        # stream of resizes is coalesced into one re-flow per frame
+        super().resizeEvent(event)
+        if self._column_count() != self._columns and not self._relayout_timer.isActive():
+            self._relayout_timer.start()
+
+    def _relayout(self):
+        columns = self._column_count()
+        if columns != self._columns:
+            self._columns = columns
+            self.doItemsLayout()
+            self._cancel_timer.start()
+
+    def _cancel_offscreen(self):
+        """Drop cover requests for cells no longer in view (or no longer shown)."""
+        area = self.viewport().rect()
+        for key, (index, _) in list(self.delegate.pending.items()):
+            if not index.isValid() or not self.visualRect(
+                    self.grid_model.index(index.row())).intersects(area):
+                self.delegate.cancel(key)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.grid_model.rowCount() == 0 and self.empty_text:
+            painter = QPainter(self.viewport())
+            painter.drawText(self.viewport().rect(), Qt.AlignCenter | Qt.TextWordWrap, self.empty_text)
+            painter.end()
+
+    def on_double_clicked(self, index):
+        game = index.data(GAME_ROLE)
+        if game is not None:
+            GameWidgetController(game.id).launch_game()
+
+    def on_context_menu(self, position):
+        index = self.indexAt(position)
+        game = index.data(GAME_ROLE) if index.isValid() else None
+        if game is None:
+            return
+        self.setCurrentIndex(index)
+        controller = GameWidgetController(game.id)
+
+        menu = QMenu(self)
+        launch_action = menu.addAction("Launch Game")
+        show_action = menu.addAction("Show in File Browser")
+        set_cover_action = menu.addAction("Set Cover Image...")
+        remove_cover_img_action = menu.addAction("Remove Cover Image")
+        tag_actions = add_tags_menu(menu, controller.tags(), controller.tag_ids())
+        remove_action = menu.addAction("Remove Game from Library")
+        selected = menu.exec(self.viewport().mapToGlobal(position))
+
+        # Cover, tag and removal changes come back through the library store's signals
+        if selected == launch_action:
+            controller.launch_game()
+
+        elif selected == show_action:
+            controller.reveal_in_file_browser()
+
+        elif selected == set_cover_action:
+            img_path, _ = QFileDialog.getOpenFileName(
+                self, "Choose Cover Image", "",
+                "Image Files (*.png *.jpg *.jpeg);;All Files (*)"
+            )
+            if img_path:
+                controller.set_cover(img_path)
+
+        elif selected == remove_cover_img_action:
+            controller.remove_cover()
+
+        elif selected in tag_actions:
+            tag_id = tag_actions[selected]
+            if tag_id is None:
+                name = ask_tag_name(self)
+                if name:
+                    controller.add_new_tag(name)
+            else:
+                controller.set_tag(tag_id, selected.isChecked())
+
+        elif selected == remove_action:
+            confirm = QMessageBox.question(
+                self, "Confirm Remove",
+                f"Remove '{game.title}' from library?",
+                QMessageBox.Yes | QMessageBox.No
+            )
+            if confirm == QMessageBox.Yes:
+                controller.delete_game()
@@ -1,5 +1,6 @@
 import sys
 import subprocess
+from bisect import bisect_left
 from pathlib import Path
 from PySide6.QtGui import QDesktopServices
 from PySide6.QtCore import QUrl
@@ -8,8 +9,18 @@ from PySide6.QtWidgets import (
     QMenu, QFileDialog, QMessageBox
 )
 from PySide6.QtGui import QPixmap, QIcon, QGuiApplication
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtCore import Qt, QSize, QTimer
 from Launcher.Controllers.PHGameListController import GameListController
+from Launcher.Utils.PHCoverLoader import cover_loader
+from Launcher.Utils.PHPixmapCache import pixmap_cache
+from Launcher.Views.PHTagMenu import add_tags_menu, ask_tag_name
+
+# Item data role holding a row's cover path
+COVER_ROLE = Qt.UserRole + 1
+# Covers are requested for the rows in view once scrolling pauses
+COVER_SYNC_MS = 50
+# Diffs touching more rows than this rebuild the table instead
+DIFF_REFRESH_THRESHOLD = 100
 
 class GameListView(QWidget):
     def __init__(self, parent=None, cover_size: QSize = QSize(64, 96)):
@@ -42,61 +53,166 @@ class GameListView(QWidget):
         # Connect double-click to launch game when in first two columns
         self.table.cellDoubleClicked.connect(self.on_cell_double_clicked)
 
+        # Covers are decoded off the GUI thread, only for rows in view, into the
+        # pixmap cache shared with the grid
+        self._pixmaps = pixmap_cache()
+        self._waiting = {}  # cover key -> cover path, requested and not yet decoded
+        self._loader = cover_loader()
+        self._loader.cover_loaded.connect(self._on_cover_loaded)
+        self._cover_timer = QTimer(self)
+        self._cover_timer.setSingleShot(True)
+        self._cover_timer.setInterval(COVER_SYNC_MS)
+        self._cover_timer.timeout.connect(self._sync_visible_covers)
+        self.table.verticalScrollBar().valueChanged.connect(self._cover_timer.start)
+        self.table.verticalScrollBar().rangeChanged.connect(self._cover_timer.start)
+
         self.refresh_list()
 
-    def refresh_list(self, filter_text: str = ""):
-        # Fetch all games via controller
-        rows = self.controller.fetch_games()
-
-        # Filter rows if a filter text is provided
-        if filter_text:
-            rows = [r for r in rows if filter_text.lower() in r[1].lower()]
-
-        self.table.setRowCount(len(rows))
-        for row_idx, (game_id, title, cover_path, last_played, play_count) in enumerate(rows):
-            # Cover art column
-            if cover_path and cover_path.strip():
-                pixmap = QPixmap(str(cover_path))
-                if not pixmap.isNull():
-                    # Scale at device pixel ratio for crisp rendering
-                    dpr = QGuiApplication.primaryScreen().devicePixelRatio()
-                    target_width = int(self.cover_size.width() * dpr)
-                    target_height = int(self.cover_size.height() * dpr)
-                    high_res = pixmap.scaled(
-                        target_width, target_height,
-                        Qt.KeepAspectRatio, Qt.SmoothTransformation
-                    )
-                    high_res.setDevicePixelRatio(dpr)
-                    icon = QIcon(high_res)
-                else:
-                    icon = QIcon()
+    def refresh_list(self, games=None):
+        # Show the given games, already filtered by the main window's view model,
+        # or every game via the controller
+        if games is None:
+            games = self.controller.fetch_games()
+
+        self.table.setRowCount(len(games))
+        for row_idx, game in enumerate(games):
+            self._set_row(row_idx, game)
+        # Row keys, kept beside the table so rows are found by bisecting
+        self._row_keys = [(g.sort_key, g.id) for g in games]
+        self._key_by_id = {g.id: key for g, key in zip(games, self._row_keys)}
+        # Search results are in rank order, where bisecting doesn't apply
+        self._in_key_order = all(a < b for a, b in zip(self._row_keys, self._row_keys[1:]))
+
+        # Adjust row heights to fit cover size
+        for i in range(self.table.rowCount()):
+            self.table.setRowHeight(i, self.cover_size.height() + 8)
+        self._cover_timer.start()
+
+    def _set_row(self, row_idx: int, game):
+        """Fill one table row from a PHGameModel."""
+        cover_path = game.cover_path if game.cover_path and game.cover_path.strip() else ""
+        # Cover art column; covers not decoded yet are filled in by _sync_visible_covers
+        cover_item = QTableWidgetItem()
+        pixmap = self._pixmaps.get(self._cover_key(game.id), cover_path) if cover_path else None
+        cover_item.setIcon(QIcon(pixmap) if pixmap is not None and not pixmap.isNull() else QIcon())
+        cover_item.setText("")  # No text in cover column
+        cover_item.setTextAlignment(Qt.AlignCenter)
+        self.table.setItem(row_idx, 0, cover_item)
+
+        # Title column
+        title_item = QTableWidgetItem(game.title)
+        title_item.setData(Qt.UserRole, game.id)
+        title_item.setData(COVER_ROLE, cover_path)
+        self.table.setItem(row_idx, 1, title_item)
+
+        # Last played column
+        last_item = QTableWidgetItem(game.last_played if game.last_played else "")
+        last_item.setTextAlignment(Qt.AlignCenter)
+        self.table.setItem(row_idx, 2, last_item)
+
+        # Play count column
+        count_item = QTableWidgetItem(str(game.play_count))
+        count_item.setTextAlignment(Qt.AlignCenter)
+        self.table.setItem(row_idx, 3, count_item)
+
+    def _remove_game_row(self, game_id: int):
+        key = self._key_by_id.pop(game_id, None)
+        if key is None:
+            return
+        row_idx = bisect_left(self._row_keys, key)
+        del self._row_keys[row_idx]
+        self.table.removeRow(row_idx)
+
+    def _insert_game_row(self, game):
+        key = (game.sort_key, game.id)
+        row_idx = bisect_left(self._row_keys, key)
+        self._row_keys.insert(row_idx, key)
+        self._key_by_id[game.id] = key
+        self.table.insertRow(row_idx)
+        self._set_row(row_idx, game)
+        self.table.setRowHeight(row_idx, self.cover_size.height() + 8)
+
+    def apply_diff(self, added, removed, changed):
+        """
+        Update only the affected rows: drop removed game ids, refresh changed games
+        in place and insert added games at their sorted position. Large batches,
+        and tables not in title order, are rebuilt instead.
+        """
+        if not self._in_key_order or len(added) + len(removed) + len(changed) > DIFF_REFRESH_THRESHOLD:
+            self.refresh_list()
+            return
+        for game_id in removed:
+            self._remove_game_row(game_id)
+        for game in changed:
+            key = self._key_by_id.get(game.id)
+            if key == (game.sort_key, game.id):
+                self._set_row(bisect_left(self._row_keys, key), game)
             else:
-                icon = QIcon()
+                # A changed title also changes the row's position, so re-insert it
+                self._remove_game_row(game.id)
+                self._insert_game_row(game)
+        for game in added:
+            if game.id not in self._key_by_id:
+                self._insert_game_row(game)
+        self._cover_timer.start()
 
-            cover_item = QTableWidgetItem()
-            cover_item.setIcon(icon)
-            cover_item.setText("")  # No text in cover column
-            cover_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row_idx, 0, cover_item)
+    # ─── Covers ──────────────────────────────────────────────────────────
 
-            # Title column
-            title_item = QTableWidgetItem(title)
-            title_item.setData(Qt.UserRole, game_id)
-            self.table.setItem(row_idx, 1, title_item)
+    def _cover_key(self, game_id: int) -> tuple:
+        # Decoded at device pixel ratio for crisp rendering
+        dpr = QGuiApplication.primaryScreen().devicePixelRatio()
+        return (game_id, self.cover_size.width(), self.cover_size.height(), dpr)
 
-            # Last played column
-            last_item = QTableWidgetItem(last_played if last_played else "")
-            last_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row_idx, 2, last_item)
+    def _visible_rows(self) -> range:
+        if self.table.rowCount() == 0:
+            return range(0)
+        first = max(0, self.table.rowAt(0))
+        last = self.table.rowAt(self.table.viewport().height() - 1)
+        if last < 0:
+            last = self.table.rowCount() - 1
+        return range(first, last + 1)
 
-            # Play count column
-            count_item = QTableWidgetItem(str(play_count))
-            count_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row_idx, 3, count_item)
+    def _sync_visible_covers(self):
+        """
+        Show decoded covers on the rows in view and request the missing ones;
+        requests for rows that have scrolled away are cancelled.
+        """
+        wanted = set()
+        for row_idx in self._visible_rows():
+            title_item = self.table.item(row_idx, 1)
+            cover_path = title_item.data(COVER_ROLE)
+            if not cover_path:
+                continue
+            key = self._cover_key(title_item.data(Qt.UserRole))
+            if not self.table.item(row_idx, 0).icon().isNull():
+                continue
+            pixmap = self._pixmaps.get(key, cover_path)
+            if pixmap is None:
+                wanted.add(key)
+                if key not in self._waiting:
+                    self._waiting[key] = cover_path
+                    dpr = key[3]
+                    size = QSize(int(key[1] * dpr), int(key[2] * dpr))
+                    self._loader.request(key, cover_path, size, dpr)
+            elif not pixmap.isNull():
+                self.table.item(row_idx, 0).setIcon(QIcon(pixmap))
+        for key in set(self._waiting) - wanted:
+            del self._waiting[key]
+            self._loader.cancel(key)
 
-        # Adjust row heights to fit cover size
-        for i in range(self.table.rowCount()):
-            self.table.setRowHeight(i, self.cover_size.height() + 8)
+    def _on_cover_loaded(self, key, image):
+        cover_path = self._waiting.pop(key, None)
+        if cover_path is None:
+            return  # Another view's request, or one cancelled since
+        # A null pixmap marks a missing or unreadable file
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(key[3])
+        self._pixmaps.put(key, cover_path, pixmap)
+        if pixmap.isNull():
+            return
+        for row_idx in self._visible_rows():
+            if self.table.item(row_idx, 1).data(Qt.UserRole) == key[0]:
+                self.table.item(row_idx, 0).setIcon(QIcon(pixmap))
 
     def on_context_menu(self, position):
         # Determine the row that was clicked
@@ -110,6 +226,7 @@ class GameListView(QWidget):
         launch_action = menu.addAction("Launch Game")
         show_action = menu.addAction("Show in File Browser")
         set_cover_action = menu.addAction("Set Cover Image...")
+        tag_actions = add_tags_menu(menu, self.controller.tags(), self.controller.tag_ids(game_id))
         remove_action = menu.addAction("Remove Game from Library")
         selected = menu.exec(self.table.viewport().mapToGlobal(position))
 
@@ -135,9 +252,17 @@ class GameListView(QWidget):
                 "Image Files (*.png *.jpg *.jpeg);;All Files (*)"
             )
             if img_path:
+                # The library store's change signal updates the row
                 self.controller.set_cover(game_id, img_path)
-                # Refresh list to show new cover
-                self.refresh_list()
+
+        elif selected in tag_actions:
+            tag_id = tag_actions[selected]
+            if tag_id is None:
+                name = ask_tag_name(self)
+                if name:
+                    self.controller.add_new_tag(game_id, name)
+            else:
+                self.controller.set_tag(game_id, tag_id, selected.isChecked())
 
         elif selected == remove_action:
             confirm = QMessageBox.question(
@@ -146,9 +271,8 @@ class GameListView(QWidget):
                 QMessageBox.Yes | QMessageBox.No
             )
             if confirm == QMessageBox.Yes:
+                # The library store's removal signal drops the row
                 self.controller.delete_game(game_id)
-                # Refresh list after removal
-                self.refresh_list()
 
     def on_cell_double_clicked(self, row: int, column: int):
         # Only launch if double-clicked in cover (col 0) or title (col 1)
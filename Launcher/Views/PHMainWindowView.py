@@ -1,23 +1,32 @@
 # Launcher/Views/PHMainWindowView.py
 from pathlib import Path
 from PySide6.QtWidgets import (
-    QMainWindow, QFileDialog, QScrollArea,
-    QWidget, QGridLayout, QLabel, QSlider,
+    QMainWindow, QFileDialog, QMenu, QToolButton,
+    QWidget, QSlider,
     QVBoxLayout, QHBoxLayout, QApplication, QDialog,
-    QLineEdit, QPushButton
+    QLineEdit, QPushButton, QProgressBar, QMessageBox
 )
 from PySide6.QtGui import QAction, QIcon, QPalette, QColor
-from PySide6.QtCore import Qt, QSize, QFileSystemWatcher
+from PySide6.QtCore import Qt, QSize, QTimer
 from Launcher.ViewModels.PHMainWindowViewModel import MainWindowViewModel
 from Launcher.ViewModels.PHSettingsDialogViewModel import SettingsDialogViewModel
-from Launcher.Views.PHGameWidgetView import GameWidgetView
+from Launcher.Views.PHGameGridView import GameGridView
 from Launcher.Views.PHGameListView import GameListView
+from Launcher.Views.PHTagMenu import ask_tag_name
 from Launcher.Views.PHSettingsDialogView import SettingsDialog
 from Launcher.Views.PHGamepadConfigView import GamepadConfigView
 from Launcher.Utils.PHAppearance import apply_theme
+from Launcher.Utils.PHPixmapCache import pixmap_cache
+from Launcher.Utils.PHThumbnailCache import thumbnail_cache
+from Launcher.Utils.PHWatchCoalescer import FolderChangeCoalescer
+from Launcher.Utils.PHWatchManager import WatchManager
 from Launcher.Utils.Utils import resource_path
 from Launcher.Controllers.PHMainWindowController import MainWindowController
 from Launcher.Controllers.PHGameListController import GameListController
+from Launcher.DB import PHDatabase
+
+# Quiet period after the last cover-size change before covers are decoded exactly
+SLIDER_SETTLE_MS = 200
 
 class MainWindowView(QMainWindow):
     def __init__(self):
@@ -25,7 +34,8 @@ class MainWindowView(QMainWindow):
         self.setWindowTitle("Perch - Game Library")
         self.resize(1000, 800)
 
-        self.current_selected_widget = None
+        # Folders that changed while a scan was running, rescanned once it finishes
+        self._queued_scan_dirs = set()
         # Instantiate ViewModel
         self.vm = MainWindowViewModel()
         # Apply the persisted theme from the ViewModel
@@ -33,17 +43,22 @@ class MainWindowView(QMainWindow):
             apply_theme(self.vm.theme)
         # Instantiate Controller
         self.controller = MainWindowController(self.vm)
+        # Every view follows the shared library store's row-level changes
+        self.vm.store.games_added.connect(self._on_games_added)
+        self.vm.store.games_removed.connect(self._on_games_removed)
+        self.vm.store.games_changed.connect(self._on_games_changed)
+        self.vm.store.tags_changed.connect(self._on_tags_changed)
 
         # ─── Watch Folders for Automatic Library Refresh ───────────────────
-        self.fs_watcher = QFileSystemWatcher(self)
+        # Whenever any watched directory changes (new file/ISO added, renamed, or removed),
+        # rescan just that folder once the burst of notifications has settled
+        self.coalescer = FolderChangeCoalescer(self.vm.watch_debounce_ms, self)
+        self.coalescer.directories_ready.connect(self._on_directories_ready)
+        self.watch_manager = WatchManager(self.vm.max_watches, self.vm.watch_poll_seconds, parent=self)
+        self.watch_manager.directory_changed.connect(self._on_folder_changed)
         # Start by watching all scan‐folders in the ViewModel
         self._reset_watch_paths()
 
-        # Whenever any watched directory changes (new file/ISO added, renamed, or removed),
-        # trigger a library refresh
-        self.fs_watcher.directoryChanged.connect(self._on_folder_changed)
-        self.fs_watcher.fileChanged.connect(self._on_folder_changed)
-
         # Initialize cover dimensions from ViewModel
         self.cover_width = self.vm.cover_width
         self.cover_height = self.vm.cover_height
@@ -55,11 +70,17 @@ class MainWindowView(QMainWindow):
         self.slider.setTickPosition(QSlider.TicksBelow)
         self.slider.setValue(self.vm.cover_width)
         self.slider.valueChanged.connect(self.on_slider_value_changed)
+        self.slider.sliderReleased.connect(self._on_slider_settled)
+        # Fires once the value stops changing (also covers keyboard and wheel steps)
+        self._slider_settle_timer = QTimer(self)
+        self._slider_settle_timer.setSingleShot(True)
+        self._slider_settle_timer.setInterval(SLIDER_SETTLE_MS)
+        self._slider_settle_timer.timeout.connect(self._on_slider_settled)
 
         # Search bar for filtering
         self.search_bar = QLineEdit()
         self.search_bar.setPlaceholderText("Search games...")
-        self.search_bar.textChanged.connect(lambda _: self.populate_grid())
+        self.search_bar.textChanged.connect(self.on_search_changed)
         # Adjust placeholder text color based on theme via palette
         current_theme = self.vm.config.get('appearance', 'theme', fallback='System Default')
         palette = self.search_bar.palette()
@@ -81,12 +102,21 @@ class MainWindowView(QMainWindow):
         add_action = QAction("Add Game...", self)
         add_action.triggered.connect(self.add_game)
         file_menu.addAction(add_action)
+        rescan_action = QAction("Rescan Library", self)
+        rescan_action.triggered.connect(self.rescan_library)
+        file_menu.addAction(rescan_action)
         settings_action = QAction("Settings...", self)
         settings_action.triggered.connect(self.open_settings)
         system_menu.addAction(settings_action)
         input_action = QAction("Controller Settings...", self)
         input_action.triggered.connect(self.open_gamepad_config)
         system_menu.addAction(input_action)
+        db_stats_action = QAction("Database Statistics...", self)
+        db_stats_action.triggered.connect(self.show_database_stats)
+        system_menu.addAction(db_stats_action)
+        cache_stats_action = QAction("Cache Statistics...", self)
+        cache_stats_action.triggered.connect(self.show_cache_stats)
+        system_menu.addAction(cache_stats_action)
         file_menu.addSeparator()
         exit_action = QAction("Exit", self)
         exit_action.triggered.connect(self.close)
@@ -97,6 +127,10 @@ class MainWindowView(QMainWindow):
         toggle_titles.setChecked(self.vm.show_titles)
         toggle_titles.triggered.connect(self.on_toggle_titles)
         view_menu.addAction(toggle_titles)
+        one_entry = QAction("One Entry per Game", self, checkable=True)
+        one_entry.setChecked(self.vm.one_entry_per_game)
+        one_entry.triggered.connect(self.on_toggle_one_entry_per_game)
+        view_menu.addAction(one_entry)
 
         # Add Grid/List view options to the View menu
         grid_action = QAction("Grid View", self)
@@ -158,6 +192,16 @@ class MainWindowView(QMainWindow):
         self.title_toggle_button.setChecked(self.vm.show_titles)
         self.title_toggle_button.toggled.connect(self.on_toggle_titles)
         view_buttons_layout.addWidget(self.title_toggle_button)
+        # Tag filter button; its menu is rebuilt each time it opens
+        self.tag_filter_button = QToolButton()
+        self.tag_filter_button.setToolTip("Filter by Tag")
+        self.tag_filter_button.setFixedHeight(48)
+        self.tag_filter_button.setPopupMode(QToolButton.InstantPopup)
+        self.tag_filter_menu = QMenu(self.tag_filter_button)
+        self.tag_filter_menu.aboutToShow.connect(self._build_tag_filter_menu)
+        self.tag_filter_button.setMenu(self.tag_filter_menu)
+        self._update_tag_filter_button()
+        view_buttons_layout.addWidget(self.tag_filter_button)
         # Align buttons to left
         view_buttons_layout.setAlignment(Qt.AlignLeft)
 
@@ -176,16 +220,9 @@ class MainWindowView(QMainWindow):
         main_layout.addLayout(search_layout)
 
 
-        # Scrollable grid container
-        self.container = QWidget()
-        self.grid = QGridLayout(self.container)
-        self.grid.setSpacing(10)
-        self.scroll = QScrollArea()
-        self.scroll.setWidgetResizable(True)
-        self.scroll.setWidget(self.container)
-        self.scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.scroll.setAlignment(Qt.AlignLeft | Qt.AlignTop)
-        main_layout.addWidget(self.scroll)
+        # Cover grid; paints only the covers scrolled into view
+        self.grid_view = GameGridView(self.cover_width, self.cover_height, self.vm.show_titles)
+        main_layout.addWidget(self.grid_view)
 
         # Create the list view container before populating
         self.list_view = GameListView(self)
@@ -196,30 +233,47 @@ class MainWindowView(QMainWindow):
         main_layout.addWidget(self.list_view)
 
         self.setCentralWidget(main_widget)
+
+        # Status bar indicator shown while a background scan is running
+        self.scan_progress = QProgressBar()
+        self.scan_progress.setRange(0, 0)  # Busy indicator; the total is unknown up front
+        self.scan_progress.setMaximumWidth(150)
+        self.scan_progress.setVisible(False)
+        self.statusBar().addPermanentWidget(self.scan_progress)
         # Show the correct view based on persisted list_mode
         if self.vm.list_mode:
             # Show list view
-            self.scroll.setVisible(False)
+            self.grid_view.setVisible(False)
             self.list_view.setVisible(True)
             self.slider.setVisible(False)
             self.title_toggle_button.setVisible(False)
-            self.list_view.refresh_list(self.vm.current_filter)
+            self._refresh_list()
         else:
             # Show grid view
-            self.scroll.setVisible(True)
+            self.grid_view.setVisible(True)
             self.list_view.setVisible(False)
             self.slider.setVisible(True)
             self.title_toggle_button.setVisible(True)
             self.populate_grid()
 
+        # Look for new games without blocking the window from showing
+        self.start_library_scan()
+
     def on_toggle_titles(self, checked: bool):
         self.vm.set_show_titles(checked)
-        self.populate_grid()
+        # Only the cell height changes; the grid re-flows without reloading anything
+        self.grid_view.set_show_titles(checked)
+
+    def on_toggle_one_entry_per_game(self, checked: bool):
+        # Collapse copies of the same image (matching fingerprints) into one grid entry
+        self.vm.set_one_entry_per_game(checked)
+        self._refresh_active_view()
 
     def open_settings(self):
 
-        # Remember whether we were in grid mode or list mode
+        # Remember whether we were in grid mode or list mode, and the tag filter
         was_list = self.vm.list_mode
+        tag_filter = (self.vm.active_tag_ids, self.vm.tag_match_all)
 
         dialog = SettingsDialog(self)
         if dialog.exec() == QDialog.Accepted:
@@ -227,12 +281,16 @@ class MainWindowView(QMainWindow):
             settings_vm = SettingsDialogViewModel()
             apply_theme(settings_vm.theme)
 
+            # Scan folders may have changed; stop any scan of the old ones
+            self.vm.cancel_scan()
             # Re-create the main ViewModel and re-watch folders
             self.vm = MainWindowViewModel()
+            self.controller.vm = self.vm
             self._reset_watch_paths()
 
             # Restore whichever view (grid or list) was active before opening Settings
             self.vm.list_mode = was_list
+            self.vm.set_tag_filter(*tag_filter)
 
             # Update search bar placeholder color after theme change
             new_theme = self.vm.config.get('appearance', 'theme', fallback='System Default')
@@ -250,72 +308,163 @@ class MainWindowView(QMainWindow):
                 self.populate_list()
             else:
                 self.populate_grid()
+            self.start_library_scan()
 
     def populate_grid(self):
         self.vm.set_list_mode(False)
         # Show grid, hide list view
-        self.scroll.setVisible(True)
+        self.grid_view.setVisible(True)
         self.list_view.setVisible(False)
         # Show slider in grid view
         self.slider.setVisible(True)
         self.title_toggle_button.setVisible(True)
 
-        # Clear existing items
-        for i in reversed(range(self.grid.count())):
-            w = self.grid.itemAt(i).widget()
-            if w:
-                w.setParent(None)
-
         # Update filter text in VM
         self.vm.set_filter(self.search_bar.text())
-        games = self.vm.get_filtered_games()
+        self._layout_grid()
 
-        # Placeholder when no games
-        text = self.search_bar.text().lower().strip()
-        if not games:
-            msg = "No games match your search." if text else "No games found. Use Settings > Scan Folders or File > Add Game..."
-            label = QLabel(msg)
-            label.setAlignment(Qt.AlignCenter)
-            self.grid.addWidget(label, 0, 0)
-            return
+    def on_search_changed(self, text: str):
+        # Re-filter whichever view is showing
+        self.vm.set_filter(text)
+        self._refresh_active_view()
 
-        # Calculate columns based on viewport width
-        spacing = self.grid.spacing()
-        w = self.scroll.viewport().width()
-        cols = max(1, (w + spacing) // (self.cover_width + spacing))
+    def _refresh_active_view(self):
+        if self.vm.list_mode:
+            self._refresh_list()
+        else:
+            self._layout_grid()
 
-        row = col = 0
-        for game in games:
-            widget = GameWidgetView(
-                game.id, game.title, game.cover_path,
-                self.cover_width, self.cover_height
+    def _refresh_list(self):
+        self.list_view.refresh_list(games=self.vm.get_filtered_games())
+
+    def _layout_grid(self):
+        """
+        Hand the filtered games to the grid model. Rows that stay are kept, so only
+        games entering the view are painted (and only once scrolled into sight).
+        """
+        games = self.vm.get_filtered_games()
+        if not games:
+            filtered = self.search_bar.text().strip() or self.vm.active_tag_ids
+            self.grid_view.set_empty_text(
+                "No games match your search." if filtered
+                else "No games found. Use Settings > Scan Folders or File > Add Game..."
             )
-            # Show or hide title below cover
-            widget.title_label.setVisible(self.vm.show_titles)
-            # Connect click signal to selection handler
-            widget.clicked.connect(self.on_game_clicked)
-            self.grid.addWidget(widget, row, col)
-            col += 1
-            if col >= cols:
-                col = 0
-                row += 1
+        self.grid_view.set_games(games)
+
+    def _on_games_added(self, games):
+        self._apply_games_diff(games, [], [])
+
+    def _on_games_removed(self, game_ids):
+        self._apply_games_diff([], game_ids, [])
+
+    def _on_games_changed(self, games):
+        self._apply_games_diff([], [], games)
+
+    def _apply_games_diff(self, added, removed, changed):
+        """Patch the visible view with row-level changes instead of rebuilding it."""
+        if not (added or removed or changed):
+            return
+        if self.vm.list_mode:
+            if self.vm.has_active_filter():
+                # Which games pass the search, tag and duplicate filters only the VM knows
+                self._refresh_list()
+            else:
+                self.list_view.apply_diff(added, removed, changed)
+            return
+        moved = self.grid_view.update_games(changed) if changed else False
+        if added or removed or moved or (changed and self.vm.has_active_filter()):
+            self._layout_grid()
+
+    def _on_tags_changed(self):
+        self._update_tag_filter_button()
+        if self.vm.active_tag_ids:
+            self._refresh_active_view()
+
+    # ─── Tag filter ──────────────────────────────────────────────────────
+
+    def _build_tag_filter_menu(self):
+        menu = self.tag_filter_menu
+        menu.clear()
+        store = self.vm.store
+        tags = store.tags()
+        for tag_id, name in tags:
+            action = menu.addAction(f"{name} ({store.tag_count(tag_id)})")
+            action.setCheckable(True)
+            action.setChecked(tag_id in self.vm.active_tag_ids)
+            action.toggled.connect(lambda checked, t=tag_id: self._toggle_tag_filter(t, checked))
+        if tags:
+            menu.addSeparator()
+        match_all = menu.addAction("Match All Selected Tags")
+        match_all.setCheckable(True)
+        match_all.setChecked(self.vm.tag_match_all)
+        match_all.toggled.connect(self._set_tag_match_all)
+        clear = menu.addAction("Clear Tag Filter")
+        clear.setEnabled(bool(self.vm.active_tag_ids))
+        clear.triggered.connect(lambda: self._apply_tag_filter(set()))
+        menu.addSeparator()
+        menu.addAction("New Tag...").triggered.connect(self._new_tag)
+        delete_menu = menu.addMenu("Delete Tag")
+        delete_menu.setEnabled(bool(tags))
+        for tag_id, name in tags:
+            delete_menu.addAction(name).triggered.connect(lambda _=False, t=tag_id, n=name: self._delete_tag(t, n))
+
+    def _toggle_tag_filter(self, tag_id: int, checked: bool):
+        tag_ids = set(self.vm.active_tag_ids)
+        if checked:
+            tag_ids.add(tag_id)
+        else:
+            tag_ids.discard(tag_id)
+        self._apply_tag_filter(tag_ids)
+
+    def _set_tag_match_all(self, match_all: bool):
+        self._apply_tag_filter(self.vm.active_tag_ids, match_all)
+
+    def _apply_tag_filter(self, tag_ids, match_all: bool | None = None):
+        self.vm.set_tag_filter(tag_ids, self.vm.tag_match_all if match_all is None else match_all)
+        self._update_tag_filter_button()
+        self._refresh_active_view()
+
+    def _update_tag_filter_button(self):
+        names = [name for tag_id, name in self.vm.store.tags() if tag_id in self.vm.active_tag_ids]
+        self.tag_filter_button.setText(f"Tags: {', '.join(names)}" if names else "Tags")
+
+    def _new_tag(self):
+        name = ask_tag_name(self)
+        if name:
+            self.vm.store.create_tag(name)
+
+    def _delete_tag(self, tag_id: int, name: str):
+        confirm = QMessageBox.question(
+            self, "Delete Tag",
+            f"Delete the tag '{name}'? Games keep everything else.",
+            QMessageBox.Yes | QMessageBox.No
+        )
+        if confirm == QMessageBox.Yes:
+            self.vm.active_tag_ids.discard(tag_id)
+            self.vm.store.delete_tag(tag_id)
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
         self.slider.setFixedWidth(self.width() // 4)
         self.search_bar.setFixedWidth(self.width() // 4)
-        if self.vm.list_mode:
-            # Refresh list view without switching to grid
-            self.list_view.refresh_list(self.vm.current_filter)
-        else:
-            self.populate_grid()
+        # Nothing is reloaded here: the list's columns stretch by themselves and
+        # the grid re-flows its cells only when its column count changes
 
     def on_slider_value_changed(self, value: int):
         self.cover_width = value
         self.cover_height = int(value * 1.5)
+        # Zoom using pre-scaled covers; exact decoding waits for the slider to settle
+        self.grid_view.zoom_to(self.cover_width, self.cover_height)
+        if not self.slider.isSliderDown():
+            self._slider_settle_timer.start()
+
+    def _on_slider_settled(self):
+        self._slider_settle_timer.stop()
+        if not self.grid_view.delegate.zooming:
+            return
         # Save cover_width via ViewModel
-        self.vm.save_cover_width(value)
-        self.populate_grid()
+        self.vm.save_cover_width(self.cover_width)
+        self.grid_view.set_cover_size(self.cover_width, self.cover_height)
 
     def add_game(self):
         paths, _ = QFileDialog.getOpenFileNames(
@@ -323,67 +472,110 @@ class MainWindowView(QMainWindow):
         )
         if not paths:
             return
+        # The library store reports the new rows to whichever view is showing
         self.controller.add_games(paths)
-        self.populate_grid()
+
+    def rescan_library(self):
+        # Full rescan ignoring the directory manifest, for recovery
+        self.start_library_scan(force_full=True)
+
+    def start_library_scan(self, force_full: bool = False, only_dirs: list[str] | None = None):
+        """
+        Scan the library folders (or just only_dirs) on a worker thread,
+        cancelling any scan in progress.
+        """
+        worker = self.vm.create_scan_worker(force_full=force_full, only_dirs=only_dirs)
+        worker.signals.games_found.connect(self._on_scan_games_found)
+        # Progress and the end of the scan only matter while this worker is current
+        worker.signals.progress.connect(lambda stats, w=worker: self._on_scan_progress(w, stats))
+        worker.signals.finished.connect(lambda stats, w=worker: self._on_scan_finished(w, stats))
+        self.scan_progress.setVisible(True)
+        self.statusBar().showMessage("Scanning library...")
+        self.vm.start_scan(worker)
+
+    def _on_scan_games_found(self, games):
+        # Streamed batch of newly added games; ignore ones a previous scan already delivered
+        self.vm.add_scanned_games(games)
+
+    def _on_scan_progress(self, worker, stats):
+        if not self.vm.is_current_scan(worker):
+            return
+        self.statusBar().showMessage(
+            f"Scanning library... {stats.dirs_visited} folders, {stats.files_matched} games"
+        )
+
+    def _on_scan_finished(self, worker, stats):
+        # Rows deleted, merged, renamed or given covers after the walk are in the
+        # database even if the scan was cancelled or replaced part-way
+        self.vm.apply_scan_changes(stats, full=worker.force_full)
+        if stats.cancelled or not self.vm.is_current_scan(worker):
+            # A newer scan (or none, after a settings change) owns the indicator
+            return
+        self.scan_progress.setVisible(False)
+        if stats.failed:
+            self.statusBar().showMessage(f"Scan failed: {stats.error}", 10000)
+        else:
+            self.statusBar().showMessage(f"Scan complete: {stats}", 10000)
+        # The manifest now lists any new or removed subfolders
+        self.watch_manager.sync_from_manifest()
+        if self._queued_scan_dirs:
+            dirs = sorted(self._queued_scan_dirs)
+            self._queued_scan_dirs.clear()
+            self.start_library_scan(only_dirs=dirs)
 
     def populate_list(self):
         self.vm.set_list_mode(True)
         self.vm.set_filter(self.search_bar.text())
-        self.vm.refresh_games()
         # Hide grid and slider, show list view
-        self.scroll.setVisible(False)
+        self.grid_view.setVisible(False)
         self.list_view.setVisible(True)
         self.slider.setVisible(False)
         self.title_toggle_button.setVisible(False)
-        self.list_view.refresh_list(self.vm.current_filter)
-
-    def on_game_clicked(self, widget):
-        # Clear previous highlight
-        if self.current_selected_widget and self.current_selected_widget is not widget:
-            self.current_selected_widget.setStyleSheet("")
-        # Highlight new selection
-        widget.setStyleSheet("border: 2px solid #FFD700;")
-        self.current_selected_widget = widget
+        self._refresh_list()
 
     def open_gamepad_config(self):
         dialog = GamepadConfigView(self)
         dialog.exec()
 
+    def show_database_stats(self):
+        # Per-statement call counts and timings collected by PHDatabase
+        box = QMessageBox(self)
+        box.setWindowTitle("Database Statistics")
+        box.setText("Queries run since Perch started:")
+        box.setDetailedText(PHDatabase.format_query_stats())
+        box.exec()
+
+    def show_cache_stats(self):
+        # Cover caches used by the grid and list views
+        box = QMessageBox(self)
+        box.setWindowTitle("Cache Statistics")
+        box.setText(f"Covers in memory: {pixmap_cache().stats()}\n"
+                    f"Thumbnails on disk: {thumbnail_cache().stats()}")
+        box.exec()
+
     def _reset_watch_paths(self):
         """
-        Replace the QFileSystemWatcher’s watched paths with the current scan_folders from settings.
+        Point the watch manager at the current scan_folders from settings; it watches
+        each folder and every subfolder the scan manifest knows about.
         """
-        # Remove old paths
-        for p in self.fs_watcher.directories():
-            self.fs_watcher.removePath(p)
-        for f in self.fs_watcher.files():
-            self.fs_watcher.removePath(f)
-
-        # Load scan folders from Settings ViewModel
         settings_vm = SettingsDialogViewModel()
-        for folder in settings_vm.scan_folders:
-            try:
-                folder_path = Path(folder)
-                if not folder_path.exists() or not folder_path.is_dir():
-                    continue
-                # Watch the folder itself
-                self.fs_watcher.addPath(folder)
-                # Also watch each file inside
-                for child in folder_path.iterdir():
-                    if child.is_file():
-                        self.fs_watcher.addPath(str(child))
-            except Exception:
-                # Skip any paths that cause errors (e.g., invalid paths)
-                continue
+        self.watch_manager.set_roots(settings_vm.scan_folders)
 
     def _on_folder_changed(self, path):
         """
         Called whenever a watched directory/file changes on disk.
-        Refresh the VM’s game list and repopulate whichever view is visible.
+        Hand the path to the coalescer, which reports the folder once it has settled.
         """
-        # Rescan the library, update VM, then re-render
-        self.vm.refresh_games()
-        if self.vm.list_mode:
-            self.populate_list()
-        else:
-            self.populate_grid()
+        self.coalescer.add(path)
+
+    def _on_directories_ready(self, dirs):
+        # Rescan only the folders that changed; new games are streamed into the visible view
+        if self.vm.is_scanning():
+            self._queued_scan_dirs.update(dirs)
+            return
+        self.start_library_scan(only_dirs=dirs)
+
+    def closeEvent(self, event):
+        # Don't keep the process alive waiting for a long scan to finish
+        self.vm.cancel_scan()
+        super().closeEvent(event)
@@ -0,0 +1,27 @@
+# Launcher/Views/PHTagMenu.py
+from PySide6.QtWidgets import QInputDialog
+
+
+def add_tags_menu(menu, tags, assigned) -> dict:
+    """
+    Add a "Tags" submenu to a game's context menu: one checkable entry per
+    (id, name) in tags, checked for the ids in assigned, then "New Tag...".
+    Returns {action: tag_id}, with None for the "New Tag..." action.
+    """
+    tags_menu = menu.addMenu("Tags")
+    actions = {}
+    for tag_id, name in tags:
+        action = tags_menu.addAction(name)
+        action.setCheckable(True)
+        action.setChecked(tag_id in assigned)
+        actions[action] = tag_id
+    if tags:
+        tags_menu.addSeparator()
+    actions[tags_menu.addAction("New Tag...")] = None
+    return actions
+
+
+def ask_tag_name(parent) -> str:
+    """Prompt for a new tag's name; '' if cancelled or left blank."""
+    name, ok = QInputDialog.getText(parent, "New Tag", "Tag name:")
+    return name.strip() if ok else ""
@@ -0,0 +1,107 @@
+# benchmarks/library_memory.py
+"""
+Memory and speed of the in-memory library representation.
+
+Builds the same synthetic library as plain dataclass records (the old
+PHGameModel) and as the current slotted PHGameModel with precomputed sort keys,
+then reports the bytes held and the time to build, sort and filter each.
+The build times count the slotted records' sort keys, so the build + sort
+lines compare the two end to end.
+
+Run from the repository root:
+    python -m benchmarks.library_memory [game_count]
+"""
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+
+from Launcher.Models.PHGameModel import PHGameModel
+from Launcher.Utils.PHSortKey import sort_key
+
+
+@dataclass
+class LegacyGameModel:
+    id: int
+    title: str
+    file_path: str
+    cover_path: str | None
+    last_played: str | None
+    play_count: int
+
+
+def synthetic_rows(count: int) -> list[tuple]:
+    """Rows as stored, with text still encoded; see fetched()."""
+    # Full-set archives hold several copies (regions, revisions) of most titles
+    rows = []
+    for i in range(count):
+        title = f"Game Title {i // 3} Edition"
+        rows.append((
+            i + 1,
+            title.encode(),
+            f"/archive/set/{i // 1000:03d}/{title} ({i % 3}).iso".encode(),
+            None if i % 4 else f"/covers/{i}.png".encode(),
+            None if i % 5 else b"2024-05-01 12:00:00",
+            i % 7,
+        ))
+    return rows
+
+
+def fetched(row: tuple) -> tuple:
+    # Like sqlite3, hand out a fresh str object for every text value
+    return tuple(v.decode() if isinstance(v, bytes) else v for v in row)
+
+
+def measure(build) -> tuple[object, int]:
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    games = build()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return games, size
+
+
+def timed(label: str, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"  {label:<28} {(time.perf_counter() - start) * 1000:8.1f} ms")
+    return result
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rows = synthetic_rows(count)
+    print(f"{count} games")
+
+    def build_legacy():
+        return [LegacyGameModel(*fetched(row)) for row in rows]
+
+    def build_compact():
+        # Sort keys are computed here, once per game, as the store does on load
+        return [PHGameModel(*fetched(row), sort_key(row[1].decode())) for row in rows]
+
+    def sort_legacy(games):
+        return sorted(games, key=lambda g: (sort_key(g.title), g.id))
+
+    def sort_compact(games):
+        return sorted(games, key=lambda g: (g.sort_key, g.id))
+
+    legacy, legacy_bytes = measure(build_legacy)
+    print(f"dataclass list:  {legacy_bytes / 1e6:7.1f} MB")
+    timed("build", build_legacy)
+    timed("sort (keys built per sort)", lambda: sort_legacy(legacy))
+    timed("build + sort", lambda: sort_legacy(build_legacy()))
+    timed("filter played", lambda: [g for g in legacy if g.play_count])
+
+    compact, compact_bytes = measure(build_compact)
+    print(f"slotted records: {compact_bytes / 1e6:7.1f} MB "
+          f"({100 * (1 - compact_bytes / legacy_bytes):.0f}% smaller)")
+    timed("build (with sort keys)", build_compact)
+    timed("sort (precomputed key)", lambda: sort_compact(compact))
+    timed("build + sort", lambda: sort_compact(build_compact()))
+    timed("filter played", lambda: [g for g in compact if g.play_count])
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,7 @@ import os
 from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QIcon
 from PySide6.QtCore import Qt
-from Launcher.DB.PHDatabase import initialize_db
+from Launcher.DB.PHDatabase import initialize_db, shutdown
 from Launcher.Utils.Utils import resource_path
 from Launcher.Views.PHMainWindowView import MainWindowView
 
@@ -20,4 +20,7 @@ if __name__ == "__main__":
     window = MainWindowView()
     window.setWindowIcon(QIcon(resource_path('Assets/app_icon.ico')))
     window.show()
-    sys.exit(app.exec())
\ No newline at end of file
+    exit_code = app.exec()
+    # Commit any play stats or cover changes still queued for the database
+    shutdown()
+    sys.exit(exit_code)
\ No newline at end of file
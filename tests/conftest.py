@@ -0,0 +1,23 @@
+# tests/conftest.py
+import os
+import tempfile
+
+import pytest
+
+# PHDatabase creates ~/.perch (and copies the template database) on import, so
+# point the home directory somewhere disposable before any test imports it
+_home = tempfile.mkdtemp(prefix="perch-tests-")
+os.environ["HOME"] = _home
+os.environ["USERPROFILE"] = _home
+
+
+@pytest.fixture
+def library_db(tmp_path, monkeypatch):
+    """An empty, fully migrated database used as this thread's database."""
+    from Launcher.DB import PHDatabase  # Only once HOME points at _home
+    PHDatabase.close_connection()
+    monkeypatch.setattr(PHDatabase, "DB_PATH", tmp_path / "perch.db")
+    PHDatabase.initialize_db()
+    yield
+    PHDatabase.flush_writes()
+    PHDatabase.close_connection()
@@ -0,0 +1,38 @@
+# tests/test_database.py
+import sqlite3
+import time
+
+from Launcher.DB import PHDatabase
+
+
+def test_locked_write_batch_is_retried(library_db, monkeypatch):
+    monkeypatch.setattr(PHDatabase, "BUSY_TIMEOUT_MS", 20)
+    monkeypatch.setattr(PHDatabase, "WRITE_RETRY_SECONDS", 0.01)
+    writer = PHDatabase.WriteBehindQueue()
+    blocker = sqlite3.connect(PHDatabase.DB_PATH, isolation_level=None)
+    blocker.execute("BEGIN IMMEDIATE")
+    try:
+        writer.submit("INSERT INTO tags (name) VALUES (?)", ("Backlog",))
+        # Reads don't wait for queued writes
+        assert PHDatabase.fetch_one("SELECT count(*) FROM tags WHERE name = 'Backlog'") == (0,)
+        time.sleep(0.3)  # Long enough to find the lock held more than once
+    finally:
+        blocker.execute("COMMIT")
+        blocker.close()
+    writer.close()
+
+    assert writer.retries > 0
+    assert writer.writes_failed == 0
+    assert PHDatabase.fetch_one("SELECT count(*) FROM tags WHERE name = 'Backlog'") == (1,)
+
+
+def test_bad_write_is_dropped_alone(library_db):
+    writer = PHDatabase.WriteBehindQueue()
+    writer.submit("INSERT INTO tags (name) VALUES (?)", ("Keep",))
+    writer.submit("INSERT INTO game_tags (game_id, tag_id) VALUES (?, ?)", (404, 404))
+    writer.submit("INSERT INTO tags (name) VALUES (?)", ("Also Keep",))
+    writer.close()
+
+    assert writer.writes_failed == 1
+    names = {name for (name,) in PHDatabase.fetch_all("SELECT name FROM tags")}
+    assert {"Keep", "Also Keep"} <= names
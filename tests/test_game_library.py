@@ -0,0 +1,47 @@
+# tests/test_game_library.py
+from Launcher.DB import PHDatabase
+from Launcher.ViewModels.PHGameLibraryViewModel import GameLibraryViewModel
+
+
+def add_games(library: GameLibraryViewModel, titles: list[str]):
+    for title in titles:
+        library.add_game(f"/games/{title}.iso")
+
+
+def read_pages(library: GameLibraryViewModel, **order) -> list[list[str]]:
+    pages = []
+    cursor = None
+    while True:
+        games, cursor = library.get_games_page(after=cursor, page_size=2, **order)
+        if games:  # A full last page is followed by an empty one
+            pages.append([g.title for g in games])
+        if cursor is None:
+            return pages
+
+
+def test_pages_follow_title_order(library_db):
+    library = GameLibraryViewModel()
+    add_games(library, ["Game 10", "Game 2", "The Game 1", "Game 3", "Game 11"])
+
+    assert read_pages(library) == [["The Game 1", "Game 2"], ["Game 3", "Game 10"], ["Game 11"]]
+    assert read_pages(library, descending=True) == [
+        ["Game 11", "Game 10"], ["Game 3", "Game 2"], ["The Game 1"]
+    ]
+
+
+def test_pages_break_ties_by_id(library_db):
+    library = GameLibraryViewModel()
+    add_games(library, ["A", "B", "C", "D"])
+    PHDatabase.execute("UPDATE games SET play_count = 1 WHERE title IN ('B', 'C', 'D')")
+
+    # Three games share a play count across the page boundary; none is skipped or repeated
+    pages = read_pages(library, sort='play_count', descending=True)
+    assert pages == [["D", "C"], ["B", "A"]]
+
+
+def test_add_game_returns_new_id_once(library_db):
+    library = GameLibraryViewModel()
+    game_id = library.add_game("/games/Halo 3.iso")
+
+    assert PHDatabase.fetch_one("SELECT title FROM games WHERE id = ?", (game_id,)) == ("Halo 3",)
+    assert library.add_game("/games/Halo 3.iso") is None
@@ -0,0 +1,106 @@
+# tests/test_library_scanner.py
+import os
+
+import pytest
+
+from Launcher.DB import PHDatabase
+from Launcher.Utils.PHLibraryScanner import LibraryScanner
+
+
+@pytest.fixture
+def library(tmp_path):
+    root = tmp_path / "lib"
+    (root / "a" / "b").mkdir(parents=True)
+    (root / "a" / "g1.iso").write_bytes(b"one")
+    (root / "a" / "b" / "g2.iso").write_bytes(b"two")
+    return root
+
+
+def game_paths() -> set[str]:
+    return {path for (path,) in PHDatabase.fetch_all("SELECT file_path FROM games")}
+
+
+def test_unchanged_directories_are_not_listed_again(library_db, library):
+    scanner = LibraryScanner([library])
+    first = scanner.scan()
+    assert (first.dirs_visited, first.dirs_listed, first.rows_inserted) == (3, 3, 2)
+
+    second = scanner.scan()
+    assert (second.dirs_visited, second.dirs_listed, second.rows_inserted) == (3, 0, 0)
+
+    # A new file changes only its own folder's mtime; that folder alone is listed
+    (library / "a" / "b" / "g3.iso").write_bytes(b"three")
+    third = scanner.scan()
+    assert (third.dirs_visited, third.dirs_listed, third.rows_inserted) == (3, 1, 1)
+    assert str(library / "a" / "b" / "g3.iso") in game_paths()
+
+
+def test_failed_listing_is_retried_next_scan(library_db, library, monkeypatch):
+    scanner = LibraryScanner([library])
+    list_directory = scanner._list_directory
+    failing = {str(library / "a" / "b")}
+
+    def flaky_list_directory(dir_path, games):
+        if dir_path in failing:
+            failing.discard(dir_path)
+            return [], None  # e.g. an I/O error before the first entry
+        return list_directory(dir_path, games)
+
+    monkeypatch.setattr(scanner, "_list_directory", flaky_list_directory)
+    scanner.scan()
+    assert game_paths() == {str(library / "a" / "g1.iso")}
+
+    # Nothing above it changed, yet the folder that failed is listed again
+    stats = scanner.scan()
+    assert stats.dirs_listed == 1
+    assert game_paths() == {str(library / "a" / "g1.iso"), str(library / "a" / "b" / "g2.iso")}
+    assert scanner.scan().dirs_listed == 0
+
+
+def test_vanished_games_are_removed(library_db, library):
+    scanner = LibraryScanner([library])
+    scanner.scan()
+    gone_path = str(library / "a" / "g1.iso")
+    game_id = PHDatabase.fetch_one("SELECT id FROM games WHERE file_path = ?", (gone_path,))[0]
+    os.unlink(gone_path)
+
+    stats = scanner.scan()
+    assert (stats.rows_removed, stats.rows_kept_missing) == (1, 0)
+    assert (stats.changed_ids, stats.removed_ids) == (set(), {game_id})
+    assert game_paths() == {str(library / "a" / "b" / "g2.iso")}
+
+
+def test_emptied_root_keeps_its_games(library_db, library):
+    scanner = LibraryScanner([library])
+    scanner.scan()
+    PHDatabase.execute("UPDATE games SET play_count = 3")
+    # What an unmounted drive leaves behind: an empty mountpoint
+    for dir_path, _, files in os.walk(library, topdown=False):
+        for name in files:
+            os.unlink(os.path.join(dir_path, name))
+        if dir_path != str(library):
+            os.rmdir(dir_path)
+
+    stats = scanner.scan()
+    assert (stats.rows_removed, stats.rows_kept_missing) == (0, 2)
+    assert PHDatabase.fetch_all("SELECT play_count FROM games") == [(3,), (3,)]
+
+
+def test_moved_game_keeps_its_row(library_db, library):
+    scanner = LibraryScanner([library])
+    scanner.scan()
+    old_path = str(library / "a" / "g1.iso")
+    game_id = PHDatabase.fetch_one("SELECT id FROM games WHERE file_path = ?", (old_path,))[0]
+    PHDatabase.execute("UPDATE games SET play_count = 5 WHERE id = ?", (game_id,))
+    (library / "c").mkdir()
+    os.rename(old_path, library / "c" / "g1.iso")
+
+    found = []
+    stats = scanner.scan(on_batch=found.extend)
+    assert (stats.rows_relinked, stats.rows_inserted, stats.rows_removed) == (1, 0, 0)
+    # The row briefly added for the new path is reported gone; the original as changed
+    assert stats.changed_ids == {game_id}
+    assert stats.removed_ids == {game.id for game in found}
+    assert PHDatabase.fetch_all("SELECT id, file_path, play_count FROM games WHERE play_count > 0") == [
+        (game_id, str(library / "c" / "g1.iso"), 5)
+    ]
@@ -0,0 +1,118 @@
+# tests/test_migrations.py
+import sqlite3
+
+import pytest
+
+from Launcher.DB import PHDatabase
+from Launcher.DB import PHMigrations
+from Launcher.DB.PHMigrations import DEFAULT_TAGS, Migration, run_migrations, refresh_sort_keys, schema_version
+from Launcher.Utils.PHSortKey import sort_key
+
+# The games table as shipped before versioned migrations (the bundled perch.db)
+BASELINE_SCHEMA = """
+CREATE TABLE games (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL,
+    file_path TEXT NOT NULL UNIQUE,
+    cover_path TEXT,
+    last_played TEXT,
+    play_count INTEGER DEFAULT 0
+)
+"""
+BASELINE_ROWS = [
+    ("Halo 10", "/games/Halo 10.iso", "/covers/halo10.png", "2024-01-02 03:04:05", 7),
+    ("Halo 3", "/games/Halo3.XEX", None, None, 0),
+    ("The Orange Box", "/games/orange/default.xex", "", None, 2),
+]
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    """A baseline database with a few games, used as this thread's database."""
+    path = tmp_path / "perch.db"
+    conn = sqlite3.connect(path)
+    conn.execute(BASELINE_SCHEMA)
+    conn.executemany(
+        "INSERT INTO games (title, file_path, cover_path, last_played, play_count) VALUES (?, ?, ?, ?, ?)",
+        BASELINE_ROWS
+    )
+    conn.commit()
+    conn.close()
+    PHDatabase.close_connection()
+    monkeypatch.setattr(PHDatabase, "DB_PATH", path)
+    yield path
+    PHDatabase.flush_writes()
+    PHDatabase.close_connection()
+
+
+def test_upgrade_from_baseline(db_path):
+    PHDatabase.initialize_db()
+    conn = PHDatabase.get_connection()
+
+    assert schema_version(conn) == 11
+    rows = conn.execute(
+        "SELECT title, file_path, cover_path, last_played, play_count, sort_key, file_ext"
+        " FROM games ORDER BY id"
+    ).fetchall()
+    # Existing data survives and every row is backfilled
+    assert [row[:5] for row in rows] == BASELINE_ROWS
+    assert [row[5] for row in rows] == [sort_key(title) for title, *_ in BASELINE_ROWS]
+    assert [row[6] for row in rows] == ["iso", "xex", "xex"]
+
+    # Natural, article-free title order through the stored keys
+    ordered = [title for (title,) in conn.execute("SELECT title FROM games ORDER BY sort_key, id")]
+    assert ordered == ["Halo 3", "Halo 10", "The Orange Box"]
+
+    # The full-text index was rebuilt from the existing rows
+    matches = conn.execute("SELECT rowid FROM games_fts WHERE games_fts MATCH 'halo*' ORDER BY rowid").fetchall()
+    assert [rowid for (rowid,) in matches] == [1, 2]
+    assert PHDatabase.search_game_ids("orange") == [3]
+
+    tags = {name for (name,) in conn.execute("SELECT name FROM tags")}
+    assert tags == set(DEFAULT_TAGS)
+
+
+def test_second_run_is_a_no_op(db_path):
+    PHDatabase.initialize_db()
+    conn = PHDatabase.get_connection()
+    before = conn.execute("SELECT * FROM games ORDER BY id").fetchall()
+    tag_count = conn.execute("SELECT count(*) FROM tags").fetchone()[0]
+
+    assert run_migrations() == []
+    assert refresh_sort_keys() is False
+    assert schema_version(conn) == 11
+    assert conn.execute("SELECT * FROM games ORDER BY id").fetchall() == before
+    assert conn.execute("SELECT count(*) FROM tags").fetchone()[0] == tag_count
+
+
+def test_explicit_connection_is_migrated_by_itself(db_path, tmp_path):
+    other = sqlite3.connect(tmp_path / "other.db")
+    other.execute(BASELINE_SCHEMA)
+    other.execute("INSERT INTO games (title, file_path) VALUES ('Halo 3', '/games/Halo3.xex')")
+    other.commit()
+
+    assert run_migrations(other, batch_size=1) == list(range(1, 12))
+    assert refresh_sort_keys(other) is True
+    assert schema_version(other) == 11
+    assert other.execute("SELECT sort_key, file_ext FROM games").fetchone() == (sort_key("Halo 3"), "xex")
+    # This thread's own database was left alone
+    assert schema_version(PHDatabase.get_connection()) == 0
+    other.close()
+
+
+def test_failed_step_is_rolled_back(db_path, tmp_path, monkeypatch):
+    def broken(conn):
+        conn.execute("CREATE TABLE half_done (id INTEGER)")
+        raise RuntimeError("interrupted")
+
+    monkeypatch.setattr(PHMigrations, "MIGRATIONS", [
+        *PHMigrations.MIGRATIONS[:1], Migration(2, "broken", broken)
+    ])
+    other = sqlite3.connect(tmp_path / "other.db")
+    with pytest.raises(RuntimeError):
+        run_migrations(other)
+
+    # Step 1 committed; step 2 left nothing behind and can simply be retried
+    assert schema_version(other) == 1
+    assert other.execute("SELECT name FROM sqlite_master WHERE name = 'half_done'").fetchone() is None
+    other.close()